@@ -1,4 +1,13 @@
+import bisect
+import heapq
+import itertools
 import math
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from plb_io import iter_instances
 
 
 class Job:
@@ -14,32 +23,102 @@ class Job:
         self.p = p
 
 
+class JobTable:
+    """
+    Συμπαγής αποθήκευση εργασιών σε στήλες array('q'): ids, d, p.
+      - Οι γραμμές κρατούνται ταξινομημένες κατά d (σταθερή ταξινόμηση).
+      - p είναι ο υπόλοιπος χρόνος εκτέλεσης και μειώνεται inline.
+      - lo: δείκτης της πρώτης μη ολοκληρωμένης εργασίας. Αφού το EDF χωρίς
+        release times ολοκληρώνει τις εργασίες με τη σειρά της προθεσμίας, οι
+        ενεργές εργασίες είναι πάντα το suffix [lo, n) και η αφαίρεση των
+        ολοκληρωμένων είναι απλή μετακίνηση του lo, χωρίς αντιγραφή.
+    Κάθε εργασία κοστίζει 24 bytes, έναντι ~250 bytes για ένα Job με __dict__.
+    """
+    __slots__ = ("ids", "d", "p", "lo")
+
+    def __init__(self, ids, d, p):
+        order = sorted(range(len(d)), key=d.__getitem__)
+        self.ids = array('q', [ids[i] for i in order])
+        self.d = array('q', [d[i] for i in order])
+        self.p = array('q', [p[i] for i in order])
+        self.lo = 0
+
+    @classmethod
+    def from_jobs(cls, jobs):
+        """ Δημιουργεί JobTable από λίστα αντικειμένων Job. """
+        return cls([j.id for j in jobs], [j.d for j in jobs], [j.p for j in jobs])
+
+    def __len__(self):
+        """ Πλήθος ενεργών (μη ολοκληρωμένων) εργασιών. """
+        return len(self.p) - self.lo
+
+    def to_jobs(self):
+        """ Επιστρέφει τις ενεργές εργασίες ως λίστα Job (για συμβατότητα). """
+        return [Job(self.ids[i], self.d[i], self.p[i]) for i in range(self.lo, len(self.p))]
+
+    def copy(self):
+        """
+        Αντίγραφο για ανεξάρτητη εκτέλεση: οι στήλες ids και d (που δεν
+        αλλάζουν) μοιράζονται, ενώ η στήλη p αντιγράφεται.
+        """
+        other = JobTable.__new__(JobTable)
+        other.ids, other.d, other.p, other.lo = self.ids, self.d, array('q', self.p), self.lo
+        return other
+
+    def insert(self, job_id, d, p):
+        """
+        Εισάγει μια εργασία διατηρώντας την ταξινόμηση κατά d. Μετά από
+        εργασίες με ίδια προθεσμία, όπως θα την έβαζε η σταθερή ταξινόμηση αν
+        είχε προστεθεί στο τέλος της λίστας εισόδου.
+        Επιστρέφει τη θέση της νέας γραμμής.
+        """
+        pos = bisect.bisect_right(self.d, d)
+        self.ids.insert(pos, job_id)
+        self.d.insert(pos, d)
+        self.p.insert(pos, p)
+        return pos
+
+
 def edf_schedule(jobs, start, end):
     """
     EDF Scheduling σε [start, end) με πραγματικό preemption.
     Επιστρέφει:
        - job_execs: λεξικό {job_id: [(start1, end1), (start2, end2), ...]}
     και στο ίδιο διάστημα μειώνει inline το p για κάθε job.
+
+    Event-driven υλοποίηση: οι διαθέσιμες εργασίες κρατούνται σε ουρά
+    προτεραιότητας (heap) με κλειδί (d, θέση στη λίστα), ώστε οι ισοπαλίες να
+    λύνονται όπως στην ταξινόμηση κατά d. Ο χρόνος μεταβαίνει απευθείας στο
+    επόμενο γεγονός (ολοκλήρωση εργασίας ή τέλος διαστήματος), οπότε το κόστος
+    είναι O(k log k) για k εργασίες και δεν εξαρτάται από το μήκος του [start, end).
+
+    Για JobTable η εκτέλεση γίνεται απευθείας στις στήλες του πίνακα: οι
+    εργασίες εκτελούνται διαδοχικά από το lo, το οποίο προχωρά καθώς
+    ολοκληρώνονται, και το job_execs περιέχει μόνο όσες εκτελέστηκαν.
     """
+    if isinstance(jobs, JobTable):
+        job_execs = {}
+        jobs.lo, _ = _edf_sorted(jobs.ids, jobs.p, jobs.lo, start, end, _dict_sink(job_execs))
+        return job_execs
+
     job_execs = {job.id: [] for job in jobs}
+    heap = [(job.d, idx, job) for idx, job in enumerate(jobs) if job.p > 0]
+    heapq.heapify(heap)
     t = start
 
-    while t < end:
-        feasible = [j for j in jobs if j.p > 0]
-        if not feasible:
-            t += 1  # Αν δεν υπάρχει διαθέσιμη εργασία, προχωράμε
-            continue
-
-        # EDF sort (πρώτα οι δουλειές με τη μικρότερη προθεσμία)
-        feasible.sort(key=lambda j: j.d)
-        chosen = feasible[0]
+    while t < end and heap:
+        # EDF: η εργασία με τη μικρότερη προθεσμία βρίσκεται στην κορυφή
+        chosen = heap[0][2]
 
         steps = min(chosen.p, end - t)
         job_execs[chosen.id].append((t, t + steps))
 
         chosen.p -= steps  # Μειώνουμε το υπόλοιπο p
-        t += steps  # Προχωράμε χρονικά
+        t += steps  # Μετάβαση στο επόμενο γεγονός
+        if chosen.p == 0:
+            heapq.heappop(heap)
 
+    # Αν δεν απομένει διαθέσιμη εργασία, το υπόλοιπο του [start, end) μένει αδρανές
     return job_execs
 
 
@@ -49,7 +128,11 @@ def plb_scheduling(jobs, T):
     Επιστρέφει:
      - calibrations (list)
      - exec_intervals: {job_id: [(start,end), ...]} συνολικά σε όλα τα intervals
+    Για JobTable χρησιμοποιείται το plb_scheduling_fast.
     """
+    if isinstance(jobs, JobTable):
+        return plb_scheduling_fast(jobs, T)
+
     jobs.sort(key=lambda j: j.d)  # Ταξινόμηση κατά προθεσμία
     calibrations = []
     exec_intervals = {jb.id: [] for jb in jobs}
@@ -102,24 +185,464 @@ def plb_scheduling(jobs, T):
     return calibrations, exec_intervals
 
 
+def _suffix_minima(d, p):
+    """
+    Για κάθε θέση i της ταξινομημένης κατά d λίστας υπολογίζει:
+      - suf_min[i]: min_{j >= i} (d[j] - prefix[j]), όπου prefix[j] = p[0] + ... + p[j]
+      - suf_arg[i]: τη μεγαλύτερη θέση j >= i όπου επιτυγχάνεται το ελάχιστο
+    (ίδια λύση ισοπαλιών με την πίσω-προς-τα-εμπρός σάρωση του plb_scheduling).
+    Οι θέσεις με p = 0 δεν είναι υποψήφιες, αφού η εργασία έχει ήδη ολοκληρωθεί.
+    """
+    n = len(d)
+    suf_min = [0] * n
+    suf_arg = [0] * n
+    prefix = list(itertools.accumulate(p))
+    best = math.inf
+    best_idx = n
+    for i in range(n - 1, -1, -1):
+        if p[i] > 0:
+            value = d[i] - prefix[i]
+            if value < best:
+                best = value
+                best_idx = i
+        suf_min[i] = best
+        suf_arg[i] = best_idx
+    return suf_min, suf_arg
+
+
+def _dict_sink(exec_intervals):
+    """ Callback emit που συλλέγει τα διαστήματα στο λεξικό {job_id: [(start, end), ...]}. """
+    def emit(job_id, start, end):
+        exec_intervals.setdefault(job_id, []).append((start, end))
+    return emit
+
+
+def _edf_sorted(ids, rem, lo, start, end, emit):
+    """
+    EDF σε [start, end) για εργασίες ήδη ταξινομημένες κατά d, χωρίς release times.
+    Χωρίς αφίξεις το EDF εκτελεί τις εργασίες διαδοχικά με τη σειρά της λίστας,
+    οπότε αρκεί ένας δείκτης lo στην πρώτη μη ολοκληρωμένη εργασία.
+    Κάθε κομμάτι εκτέλεσης δίνεται στο emit(job_id, start, end).
+    Επιστρέφει:
+      - τον νέο δείκτη lo
+      - τον χρόνο εκτέλεσης που καταναλώθηκε στο διάστημα
+    """
+    n = len(rem)
+    t = start
+    while t < end and lo < n:
+        if rem[lo] == 0:
+            lo += 1
+            continue
+        steps = min(rem[lo], end - t)
+        emit(ids[lo], t, t + steps)
+        rem[lo] -= steps
+        t += steps
+        if rem[lo] == 0:
+            lo += 1
+    return lo, t - start
+
+
+def plb_scheduling_fast(jobs, T):
+    """
+    Preemptive Lazy Binning με σταδιακό υπολογισμό των t και k_index.
+    Δέχεται λίστα Job ή JobTable και δίνει ακριβώς τα ίδια calibrations και
+    exec_intervals με το plb_scheduling.
+
+    Αφού όλες οι εργασίες είναι διαθέσιμες από τη στιγμή 0, το EDF καταναλώνει
+    πάντα χρόνο εκτέλεσης από την αρχή της ταξινομημένης κατά d λίστας: οι
+    ενεργές εργασίες είναι ένα suffix [lo, n) και, αν C είναι ο συνολικός χρόνος
+    που έχει εκτελεστεί, το υπόλοιπο prefix sum της θέσης i είναι prefix[i] - C.
+    Έτσι σε κάθε γύρο
+        t = min_{i >= lo} (d_i - prefix_i) + C
+    και το k_index είναι η θέση του ελαχίστου, δηλαδή ένα lookup σε suffix-min
+    πίνακα που χτίζεται μία φορά σε O(n). Ο συνολικός χρόνος είναι O(n log n)
+    (ταξινόμηση) αντί για O(n²).
+    Οι εργασίες με p = 0 θεωρούνται ήδη ολοκληρωμένες.
+    """
+    if isinstance(jobs, JobTable):
+        table = jobs
+    else:
+        jobs.sort(key=lambda j: j.d)  # Ταξινόμηση κατά προθεσμία
+        table = JobTable.from_jobs(jobs)
+
+    exec_intervals = {table.ids[i]: [] for i in range(table.lo, len(table.p))}
+    calibrations = _plb_table(table, T, _dict_sink(exec_intervals))
+    if calibrations is None:
+        return [], {}
+
+    if not isinstance(jobs, JobTable):
+        for job, p_left in zip(jobs, table.p):
+            job.p = p_left  # Όπως στο plb_scheduling, το p μένει ως υπόλοιπος χρόνος
+
+    return calibrations, exec_intervals
+
+
+def _plb_table(table, T, emit, suffix=None, consumed=0, on_round=None):
+    """
+    Ο κύριος βρόχος του plb_scheduling_fast πάνω σε JobTable.
+    Τα κομμάτια εκτέλεσης δίνονται στο emit(job_id, start, end) με χρονική σειρά.
+    Προαιρετικά (για συνέχιση από ενδιάμεσο γύρο, βλ. PLBScheduler):
+      - suffix: έτοιμοι πίνακες (suf_min, suf_arg) και consumed ο χρόνος C που
+        έχει ήδη εκτελεστεί ως προς τα prefix sums τους
+      - on_round(lo, consumed, t, u, lo_after, consumed_after): καλείται στο τέλος
+        κάθε γύρου, με [t, u) το calibrated διάστημα του γύρου
+    Επιστρέφει τη λίστα calibrations ή None αν το πρόγραμμα είναι ανέφικτο.
+    """
+    ids, d, rem = table.ids, table.d, table.p
+    if suffix is None:
+        suf_min, suf_arg = _suffix_minima(d, rem)
+        consumed = 0  # C: χρόνος εκτέλεσης που έχει δοθεί από αυτή την κλήση
+    else:
+        suf_min, suf_arg = suffix
+
+    n = len(rem)
+    lo = table.lo
+    last = n - 1
+    while last >= lo and rem[last] == 0:
+        last -= 1
+    max_deadline = d[last] if last >= lo else 0
+    calibrations = []
+    round_start = lo
+
+    while lo < n:
+        if rem[lo] == 0:
+            lo += 1
+            continue
+        t = suf_min[lo] + consumed
+        k_index = suf_arg[lo]
+        if t < 0:
+            print("Infeasible schedule: start time < 0")
+            return None
+
+        d_k = d[k_index]
+        delta = d_k - t
+        if delta < 0:
+            print("Infeasible schedule: d_k < t.")
+            return None
+
+        adaptive_T = min(T, max_deadline - t)  # Περιορισμός του T
+        needed_segments = max(1, math.ceil(delta / adaptive_T))
+        u = min(t + needed_segments * adaptive_T, max_deadline)
+
+        calibrations.append(u)  # Προσθήκη μόνο του τελικού calibration
+
+        # --- [t, d_k): EDF για τις εργασίες lo..k_index (ολοκληρώνονται ακριβώς)
+        consumed_before = consumed
+        lo, used = _edf_sorted(ids, rem, lo, t, d_k, emit)
+        consumed += used
+
+        # --- [d_k, u): EDF για τα υπόλοιπα
+        if d_k < u:
+            lo, used = _edf_sorted(ids, rem, lo, d_k, u, emit)
+            consumed += used
+
+        if on_round is not None:
+            on_round(round_start, consumed_before, t, u, lo, consumed)
+        round_start = lo
+
+    table.lo = lo
+    return calibrations
+
+
+class IntervalMerger:
+    """
+    Callback που συγχωνεύει διαδοχικά κομμάτια της ίδιας εργασίας:
+    [a, b) και αμέσως μετά [b, c) δίνονται στο sink ως ένα [a, c).
+    Κρατά στη μνήμη μόνο το τελευταίο ανοιχτό διάστημα. Στο τέλος χρειάζεται flush().
+    """
+    __slots__ = ("sink", "job_id", "start", "end")
+
+    def __init__(self, sink):
+        self.sink = sink
+        self.job_id = None
+        self.start = 0
+        self.end = 0
+
+    def __call__(self, job_id, start, end):
+        if job_id == self.job_id and start == self.end:
+            self.end = end
+            return
+        self.flush()
+        self.job_id, self.start, self.end = job_id, start, end
+
+    def flush(self):
+        if self.job_id is not None:
+            self.sink(self.job_id, self.start, self.end)
+            self.job_id = None
+
+
+class IntervalColumns:
+    """
+    Συμπαγής (columnar) μορφή των exec_intervals: τρεις στήλες array('q')
+    job_id, start, end με ένα διάστημα ανά γραμμή, σε χρονική σειρά.
+    Το append μπορεί να χρησιμοποιηθεί απευθείας ως callback.
+    """
+    __slots__ = ("job_id", "start", "end")
+
+    def __init__(self):
+        self.job_id = array('q')
+        self.start = array('q')
+        self.end = array('q')
+
+    def append(self, job_id, start, end):
+        self.job_id.append(job_id)
+        self.start.append(start)
+        self.end.append(end)
+
+    def __len__(self):
+        return len(self.job_id)
+
+    def __iter__(self):
+        return zip(self.job_id, self.start, self.end)
+
+    def to_dict(self):
+        """ Μετατροπή στη μορφή {job_id: [(start, end), ...]} του plb_scheduling. """
+        exec_intervals = {}
+        for job_id, start, end in self:
+            exec_intervals.setdefault(job_id, []).append((start, end))
+        return exec_intervals
+
+
+def plb_scheduling_stream(jobs, T, on_interval, merge=True, on_window=None):
+    """
+    PLB (όπως το plb_scheduling_fast) που δεν κρατά τα διαστήματα εκτέλεσης:
+    κάθε διάστημα δίνεται στο on_interval(job_id, start, end) μόλις παραχθεί,
+    σε χρονική σειρά. Με merge=True τα συνεχόμενα κομμάτια της ίδιας εργασίας
+    συγχωνεύονται. Η μνήμη δεν αυξάνεται με το πλήθος των preemptions.
+    Αν δοθεί on_window(start, end), καλείται για το calibrated διάστημα [t, u)
+    κάθε γύρου (διαδοχικά calibrations μήκους το πολύ T).
+    Επιστρέφει:
+     - calibrations (list), ή [] αν το πρόγραμμα είναι ανέφικτο (τα διαστήματα
+       που έχουν ήδη δοθεί στο on_interval τότε δεν ισχύουν)
+    """
+    table = jobs if isinstance(jobs, JobTable) else JobTable.from_jobs(jobs)
+    emit = IntervalMerger(on_interval) if merge else on_interval
+    on_round = None
+    if on_window is not None:
+        def on_round(lo, consumed, t, u, lo_after, consumed_after):
+            on_window(t, u)
+    calibrations = _plb_table(table, T, emit, on_round=on_round)
+    if merge:
+        emit.flush()
+    return calibrations or []
+
+
+def plb_scheduling_columnar(jobs, T, merge=True):
+    """
+    PLB με έξοδο σε columnar μορφή.
+    Επιστρέφει:
+     - calibrations (list)
+     - IntervalColumns με στήλες job_id, start, end
+    """
+    columns = IntervalColumns()
+    calibrations = plb_scheduling_stream(jobs, T, columns.append, merge)
+    if not calibrations:
+        return [], IntervalColumns()
+    return calibrations, columns
+
+
+class PLBScheduler:
+    """
+    Online (incremental) PLB: κρατά τα calibrations και την κατάσταση του EDF
+    και δέχεται νέες εργασίες με add_job(id, d, p), δίνοντας πάντα το ίδιο
+    αποτέλεσμα με ένα πλήρες plb_scheduling_fast σε όλες τις εργασίες.
+
+    Για κάθε γύρο r κρατείται ένα checkpoint: lo_r, ο χρόνος C_r που είχε
+    εκτελεστεί πριν τον γύρο, m_r = t_r - C_r, η τελευταία θέση e_r που
+    εκτελέστηκε και το πλήθος των διαστημάτων πριν τον γύρο. Μια νέα εργασία
+    που μπαίνει στη θέση j αφήνει αμετάβλητο τον γύρο r όταν:
+      - δεν αλλάζει τη μέγιστη προθεσμία (από την οποία εξαρτάται το u),
+      - e_r < j, δηλαδή ο γύρος δεν άγγιξε καμία εργασία από τη θέση j και μετά,
+      - ο γύρος δεν εξάντλησε όλη τη δουλειά (αλλιώς η νέα εργασία θα έτρεχε σε αυτόν),
+      - min_{i >= j} (d_i - prefix_i) > m_r στους νέους πίνακες, ώστε το t και
+        το k_index του γύρου να μη μετακινούνται.
+    Τα e_r και m_r είναι μη φθίνοντα, άρα οι επηρεαζόμενοι γύροι είναι ένα
+    suffix: οι προηγούμενοι κρατιούνται και επαναϋπολογίζονται μόνο οι
+    υπόλοιποι, ξεκινώντας από το αντίστοιχο checkpoint.
+    """
+
+    def __init__(self, T, jobs=()):
+        self.T = T
+        if isinstance(jobs, JobTable):
+            table = JobTable(jobs.ids[jobs.lo:], jobs.d[jobs.lo:], jobs.p[jobs.lo:])
+        else:
+            table = JobTable.from_jobs(sorted(jobs, key=lambda j: j.d))
+        self.table = table
+        self.p0 = array('q', table.p)  # Αρχικοί χρόνοι εκτέλεσης
+        self.prefix = array('q', itertools.accumulate(self.p0))
+        self.intervals = IntervalColumns()
+        self.feasible = True
+
+        self._calibrations = []
+        self._lo = array('q')
+        self._consumed = array('q')
+        self._min = []
+        self._last = array('q')
+        self._offset = array('q')
+        self._solve_from(0)
+
+    @property
+    def calibrations(self):
+        return list(self._calibrations) if self.feasible else []
+
+    @property
+    def exec_intervals(self):
+        """ Τα διαστήματα εκτέλεσης στη μορφή {job_id: [(start, end), ...]}. """
+        if not self.feasible:
+            return {}
+        exec_intervals = {self.table.ids[i]: [] for i in range(len(self.p0))}
+        exec_intervals.update(self.intervals.to_dict())
+        return exec_intervals
+
+    def add_job(self, job_id, d, p):
+        """
+        Προσθέτει μια εργασία και επαναϋπολογίζει μόνο τους γύρους που επηρεάζονται.
+        Επιστρέφει το πλήθος των calibrations που έμειναν αμετάβλητα.
+        """
+        n = len(self.p0)
+        max_deadline = self._max_deadline()
+        exhausted = n > 0 and self._consumed_total == self.prefix[-1]
+        j = self.table.insert(job_id, d, p)
+        self.p0.insert(j, p)
+        base = self.prefix[j - 1] if j > 0 else 0
+        self.prefix[j:] = array('q', itertools.accumulate(self.p0[j:], initial=base))[1:]
+
+        if not self.feasible or not self._calibrations or (p > 0 and d > max_deadline):
+            first = 0
+        else:
+            new_min = min((self.table.d[i] - self.prefix[i] for i in range(j, n + 1) if self.p0[i] > 0),
+                          default=math.inf)
+            first = min(
+                bisect.bisect_left(self._last, j),
+                bisect.bisect_left(self._min, new_min),
+            )
+            if first == len(self._calibrations) and exhausted:
+                first -= 1  # Ο τελευταίος γύρος θα εκτελούσε τη νέα εργασία στον αδρανή χρόνο
+        self._solve_from(first)
+        return first
+
+    def _max_deadline(self):
+        for i in range(len(self.p0) - 1, -1, -1):
+            if self.p0[i] > 0:
+                return self.table.d[i]
+        return 0
+
+    def _solve_from(self, first):
+        """ Επαναϋπολογίζει τους γύρους first, first+1, ... από το checkpoint του first. """
+        if first < len(self._lo):
+            lo, consumed, offset = self._lo[first], self._consumed[first], self._offset[first]
+        else:
+            lo, consumed, offset = 0, 0, 0
+
+        del self._calibrations[first:]
+        for column in (self._lo, self._consumed, self._min, self._last, self._offset):
+            del column[first:]
+        for column in (self.intervals.job_id, self.intervals.start, self.intervals.end):
+            del column[offset:]
+
+        # Επαναφορά των υπολοίπων χρόνων από το lo και μετά
+        rem, n = self.table.p, len(self.p0)
+        rem[lo:] = self.p0[lo:]
+        if lo < n:
+            rem[lo] = self.prefix[lo] - consumed
+        self.table.lo = lo
+
+        self._next_offset = offset
+        self._consumed_total = consumed
+        calibrations = _plb_table(self.table, self.T, self.intervals.append,
+                                  suffix=self._suffix_from(lo), consumed=consumed,
+                                  on_round=self._record_round)
+        self.feasible = calibrations is not None
+        if self.feasible:
+            self._calibrations.extend(calibrations)
+
+    def _suffix_from(self, lo):
+        """ Suffix minima του d_i - prefix_i για i >= lo (οι θέσεις < lo δεν χρησιμοποιούνται). """
+        d, prefix, p0 = self.table.d, self.prefix, self.p0
+        n = len(p0)
+        suf_min = [0] * n
+        suf_arg = [0] * n
+        best = math.inf
+        best_idx = n
+        for i in range(n - 1, lo - 1, -1):
+            if p0[i] > 0:
+                value = d[i] - prefix[i]
+                if value < best:
+                    best = value
+                    best_idx = i
+            suf_min[i] = best
+            suf_arg[i] = best_idx
+        return suf_min, suf_arg
+
+    def _record_round(self, lo, consumed, t, u, lo_after, consumed_after):
+        rem, p0 = self.table.p, self.p0
+        touched = lo_after < len(p0) and rem[lo_after] < p0[lo_after]
+        self._lo.append(lo)
+        self._consumed.append(consumed)
+        self._min.append(t - consumed)
+        self._last.append(lo_after if touched else lo_after - 1)
+        self._offset.append(self._next_offset)
+        self._next_offset = len(self.intervals)
+        self._consumed_total = consumed_after
+
+
+# Κοινή κατάσταση των workers του plb_sweep: (table, suffix)
+_sweep_state = None
+
+
+def _sweep_init(table, suffix):
+    global _sweep_state
+    _sweep_state = (table, suffix)
+
+
+def _sweep_solve(T):
+    """ Λύνει το κοινό instance για ένα T. Επιστρέφει (T, πλήθος calibrations, sec). """
+    table, suffix = _sweep_state
+    start = time.perf_counter()
+    calibrations = _plb_table(table.copy(), T, _discard, suffix=suffix)
+    return T, len(calibrations or []), time.perf_counter() - start
+
+
+def _discard(job_id, start, end):
+    pass
+
+
+def plb_sweep(jobs, T_values, workers=None):
+    """
+    Λύνει το ίδιο σύνολο εργασιών για πολλά μήκη calibration T.
+    Η ταξινόμηση κατά d και οι πίνακες suffix minima του d_i - prefix_i δεν
+    εξαρτώνται από το T, οπότε υπολογίζονται μία φορά και μοιράζονται σε
+    όλες τις επιλύσεις. Κάθε T χρειάζεται μόνο ένα αντίγραφο της στήλης p.
+    Οι επιλύσεις τρέχουν σε pool από workers processes (προεπιλογή: όλοι οι
+    πυρήνες, workers=1 για εκτέλεση στο ίδιο process) χωρίς να κρατούν
+    τα διαστήματα εκτέλεσης.
+    Επιστρέφει:
+     - {T: (πλήθος calibrations, sec)}, με 0 calibrations αν το πρόγραμμα είναι ανέφικτο
+    """
+    if isinstance(jobs, JobTable):
+        table = JobTable(jobs.ids[jobs.lo:], jobs.d[jobs.lo:], jobs.p[jobs.lo:])
+    else:
+        table = JobTable.from_jobs(jobs)
+    suffix = _suffix_minima(table.d, table.p)
+
+    T_values = list(T_values)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(T_values) == 1:
+        _sweep_init(table, suffix)
+        results = map(_sweep_solve, T_values)
+        return {T: (count, sec) for T, count, sec in results}
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(T_values)),
+                             initializer=_sweep_init, initargs=(table, suffix)) as pool:
+        return {T: (count, sec) for T, count, sec in pool.map(_sweep_solve, T_values)}
+
+
 def main(input_file_path):
-    with open(input_file_path, 'r', encoding='utf-8') as f:
-        lines = [l.strip() for l in f if l.strip()]
-
-    T = int(lines[0])
-    N = int(lines[1])
-
-    all_jobs = []
-    idx_line = 2
-    for _ in range(N):
-        parts = lines[idx_line].split()
-        idx_line += 1
-        job_id = int(parts[0])
-        d = int(parts[2])
-        p = int(parts[3])
-        all_jobs.append(Job(job_id, d, p))
-
-    calibrations, exec_intervals = plb_scheduling(all_jobs, T)
+    # Το πρώτο instance του αρχείου (κειμένου ή .plbin, βλ. plb_io.py)
+    T, ids, deadlines, times = next(iter_instances(input_file_path))
+
+    all_jobs = JobTable(ids, deadlines, times)
+    calibrations, exec_intervals = plb_scheduling_fast(all_jobs, T)
 
     print("\n--- FINAL SCHEDULING OUTPUT ---")
     print("Calibration times:", calibrations)
@@ -1,5 +1,8 @@
+import warnings
 from collections import defaultdict
-import random
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
 
 def normalize_machine_names(machine_list):
     """
@@ -41,6 +44,177 @@ def read_jobs_from_file(filename):
     return jobs
 
 
+# Μέγεθος κομματιού ανάγνωσης και μέγιστο μήκος (bytes) του τμήματος μηχανών μιας γραμμής
+# για τη γρήγορη ανάγνωση
+JOB_CHUNK_BYTES = 1 << 20
+MACHINES_FIELD_BYTES = 16
+
+
+def _parse_job_lines_slow(data, first_line, jobs_single, totals):
+    """ Ανάγνωση γραμμή-γραμμή με τα μηνύματα του read_jobs_from_file, για blocks με μη έγκυρες γραμμές. """
+    for line_num, line in enumerate(data.decode(errors="replace").split("\n"), start=first_line):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            parts = line.split(":")
+            if len(parts) != 2:
+                print(f"Παράλειψη γραμμής {line_num}: '{line}' (Μη έγκυρη μορφή)")
+                continue
+            machines = tuple(sorted(normalize_machine_names(parts[0].split())))
+            time_val = int(parts[1].strip())
+            totals[machines] += time_val
+            if len(machines) == 1:
+                jobs_single[machines].append(np.array([time_val], dtype=np.int64))
+        except ValueError as ve:
+            print(f"Λανθασμένη τιμή στη γραμμή {line_num}: {line} (Σφάλμα: {ve})")
+        except Exception as e:
+            print(f"Απροσδόκητο σφάλμα στη γραμμή {line_num}: {e}")
+
+
+def _machine_field_codes(buf, line_start, colon, machine_keys):
+    """
+    Κωδικός συνόλου μηχανών για κάθε γραμμή, από τα bytes πριν από το ':'. Τα
+    bytes κάθε γραμμής (έως MACHINES_FIELD_BYTES) διαβάζονται ως δύο uint64 και οι
+    διαφορετικές τιμές (ελάχιστες) κανονικοποιούνται μία φορά η καθεμία.
+    machine_keys: {bytes μηχανών: tuple μηχανών}, κοινό για όλα τα κομμάτια.
+    Επιστρέφει (codes, keys) με keys[codes[i]] το tuple μηχανών της γραμμής i
+    (τα keys χωρίς επαναλήψεις).
+    """
+    padded = np.concatenate((buf, np.zeros(MACHINES_FIELD_BYTES, dtype=np.uint8)))
+    windows = as_strided(padded, shape=(len(buf) + 8, 8), strides=(1, 1))
+    # keep_bytes[k]: μάσκα των k χαμηλότερων bytes ενός uint64 (little-endian)
+    keep_bytes = np.array([(1 << (8 * k)) - 1 for k in range(9)], dtype=np.uint64)
+    width = colon - line_start
+    words = np.zeros((len(line_start), 2), dtype=np.uint64)
+    words[:, 0] = windows[line_start].view("<u8").ravel() & keep_bytes[np.minimum(width, 8)]
+    if np.any(width > 8):
+        words[:, 1] = windows[line_start + 8].view("<u8").ravel() & keep_bytes[np.clip(width - 8, 0, 8)]
+
+    if not words[:, 1].any():
+        # Συνήθης περίπτωση (έως 8 bytes, π.χ. "M1 M2 "): μονοδιάστατο unique, πολύ ταχύτερο
+        raw_values, raw_codes = np.unique(words[:, 0], return_inverse=True)
+        raw_values = np.stack((raw_values, np.zeros_like(raw_values)), axis=1)
+    else:
+        raw_values, raw_codes = np.unique(words, axis=0, return_inverse=True)
+    # Διαφορετικά bytes (π.χ. "M1" και "m1 ") μπορεί να δίνουν το ίδιο tuple μηχανών
+    keys, key_code = [], np.empty(len(raw_values), dtype=np.int64)
+    for i, raw in enumerate(raw_values):
+        raw = raw.tobytes().rstrip(b"\0")
+        if raw not in machine_keys:
+            machine_keys[raw] = tuple(sorted(normalize_machine_names(raw.decode(errors="replace").split())))
+        if machine_keys[raw] not in keys:
+            keys.append(machine_keys[raw])
+        key_code[i] = keys.index(machine_keys[raw])
+    return key_code[raw_codes.ravel()], keys
+
+
+def parse_job_block(data, first_line=1, machine_keys=None, jobs_single=None, totals=None):
+    """
+    Επεξεργάζεται ένα block (bytes) από γραμμές "M1 M2 : 10" χωρίς βρόχο Python ανά
+    γραμμή, με πράξεις NumPy πάνω στα bytes: κάθε μη κενή γραμμή πρέπει να έχει
+    ακριβώς ένα ':', τα bytes μέχρι το ':' γίνονται κενά και οι χρόνοι διαβάζονται
+    με μία κλήση του np.fromstring, ενώ το σύνολο μηχανών κάθε γραμμής προκύπτει
+    από τα bytes πριν από το ':'. Κρατά μόνο τους χρόνους των μονομηχανιακών
+    εργασιών (σε jobs_single[key] ως λίστα από πίνακες int64) και το άθροισμα κάθε
+    συνόλου μηχανών (totals). Αν το block έχει μη έγκυρες γραμμές, διαβάζεται
+    γραμμή-γραμμή με τα ίδια μηνύματα με το read_jobs_from_file (first_line:
+    αριθμός της πρώτης γραμμής του block).
+    Επιστρέφει (jobs_single, totals).
+    """
+    machine_keys = {} if machine_keys is None else machine_keys
+    jobs_single = defaultdict(list) if jobs_single is None else jobs_single
+    totals = defaultdict(int) if totals is None else totals
+
+    buf = np.frombuffer(data, dtype=np.uint8)
+    newline_at = np.flatnonzero(buf == 10)
+    line_start = np.concatenate(([0], newline_at + 1))
+    if line_start[-1] == len(buf):
+        line_start = line_start[:-1]
+    blank = (buf == 10) | (buf == 32) | (buf == 9) | (buf == 13) | (buf == 11) | (buf == 12)
+    nonblank_line = np.logical_or.reduceat(~blank, line_start) if len(buf) else np.zeros(0, dtype=bool)
+    colon = np.flatnonzero(buf == 58)
+    colons_per_line = np.bincount(np.searchsorted(newline_at, colon), minlength=len(line_start))
+
+    times = None
+    if np.array_equal(colons_per_line, nonblank_line):
+        line_start = line_start[nonblank_line]
+        if np.all(colon - line_start <= MACHINES_FIELD_BYTES):
+            # Τα bytes από την αρχή κάθε γραμμής έως και το ':' γίνονται κενά, ώστε να μείνουν
+            # μόνο οι χρόνοι: εναλλασσόμενα τμήματα [αρχή, ':'] (κενά) και (':', επόμενη αρχή)
+            bounds = np.empty(2 * len(line_start) + 2, dtype=np.int64)
+            bounds[0], bounds[-1] = 0, len(buf)
+            bounds[1:-1:2], bounds[2:-1:2] = line_start, colon + 1
+            machine_part = np.repeat(np.arange(len(bounds) - 1) % 2 == 1, np.diff(bounds))
+            numbers = np.where(machine_part, np.uint8(32), buf)
+            # Ακριβώς ένα πεδίο μετά το ':' σε κάθε μη κενή γραμμή, που δεν είναι μόνο πρόσημο
+            # (το np.fromstring διαβάζει το "-" ως 0 και δεν ξέρει σε ποια γραμμή ανήκει κάθε τιμή)
+            gap = ((numbers == 10) | (numbers == 32) | (numbers == 9) | (numbers == 13)
+                   | (numbers == 11) | (numbers == 12))
+            token_start = np.flatnonzero(gap[:-1] > gap[1:]) + 1
+            if len(buf) and not gap[0]:
+                token_start = np.concatenate(([0], token_start))
+            tokens_per_line = np.bincount(np.searchsorted(newline_at, token_start), minlength=len(nonblank_line))
+            sign = (numbers[token_start] == 43) | (numbers[token_start] == 45)
+            token_end = np.minimum(token_start + 1, len(buf) - 1)
+            lone_sign = sign & ((token_start + 1 == len(buf)) | gap[token_end])
+            single_field = np.array_equal(tokens_per_line, nonblank_line) and not lone_sign.any()
+        else:
+            single_field = False
+        if single_field:
+            # Το np.fromstring σταματά (με warning) στο πρώτο πεδίο που δεν είναι ακέραιος
+            with warnings.catch_warnings():
+                warnings.simplefilter("error", DeprecationWarning)
+                try:
+                    times = np.fromstring(numbers.tobytes(), dtype=np.int64, sep=" ")
+                except (ValueError, DeprecationWarning):
+                    times = None
+            if times is not None and len(times) != len(line_start):
+                times = None
+
+    if times is None:
+        _parse_job_lines_slow(data, first_line, jobs_single, totals)
+        return jobs_single, totals
+    if not len(times):
+        return jobs_single, totals
+
+    codes, keys = _machine_field_codes(buf, line_start, colon, machine_keys)
+    for code, key in enumerate(keys):
+        selected = times[codes == code]
+        totals[key] += int(selected.sum())
+        if len(key) == 1:
+            jobs_single[key].append(selected)
+    return jobs_single, totals
+
+
+def load_jobs_aggregated(filename, chunk_bytes=JOB_CHUNK_BYTES):
+    """
+    Streaming εκδοχή του read_jobs_from_file για μεγάλα αρχεία: διαβάζει το αρχείο
+    σε κομμάτια των chunk_bytes (σε όρια γραμμών) και κρατά μόνο:
+      - jobs: {('m1',): πίνακας int64 με τους χρόνους, με τη σειρά του αρχείου, ...}
+        για τις μονομηχανιακές εργασίες, που χρειάζεται το partition_jobs_goesman
+      - totals: {tuple μηχανών: συνολικός χρόνος} για όλα τα σύνολα μηχανών
+    Επιστρέφει (jobs, totals), κατάλληλα για το calculate_partition_values(jobs, totals).
+    """
+    machine_keys = {}
+    jobs_single, totals = defaultdict(list), defaultdict(int)
+    line_num = 1
+    rest = b""
+    with open(filename, 'rb') as file:
+        while True:
+            chunk = file.read(chunk_bytes)
+            data = rest + chunk
+            cut = len(data) if not chunk else data.rfind(b"\n") + 1
+            block, rest = data[:cut], data[cut:]
+            parse_job_block(block, line_num, machine_keys, jobs_single, totals)
+            line_num += block.count(b"\n")
+            if not chunk:
+                break
+
+    jobs = {key: np.concatenate(parts) for key, parts in jobs_single.items()}
+    return jobs, dict(totals)
+
+
 def partition_jobs_goesman(jobs, machine):
     """
         Διαχωρίζει τα μονομηχανιακά jobs της μορφής (machine,) σε (Long) και (Short) σύμφωνα με βελτιωμένη λογική:
@@ -49,90 +223,93 @@ def partition_jobs_goesman(jobs, machine):
          - Αν καμία εργασία δεν είναι >= 2/3, επιλέγουμε εργασίες για το S_{iL} έτσι ώστε:
            1/3 <= sum(S_{iL}) <= 2/3 της συνολικής διάρκειας.
          - Εξασφαλίζουμε ότι sum(S_{iL}) >= sum(S_{iS}).
+        Οι χρόνοι είναι πίνακας int64 και το S_{iL} μια boolean μάσκα πάνω του, με
+        τρέχοντα αθροίσματα, οπότε το κόστος είναι O(n) και το αποτέλεσμα ντετερμινιστικό.
+        Οι συγκρίσεις με τα 1/3 και 2/3 γίνονται σε ακέραιους (3 * sum έναντι total).
+        Επιστρέφει (S_L, S_S) ως πίνακες με τη σειρά του αρχείου.
         """
-    # Συνολικός χρόνος μηχανής και προσωρινή αποθήκευση χρόνου κάθε εργασίας
-    machine_total_time = 0
-    timeslist = []
-    for key, value in jobs.items():
-        # Εξασφαλίζουμε ότι λαμβάνονται μόνο οι μονομηχανιακές εργασίες
-        if key == (machine,):
-            machine_total_time += sum(value)
-            timeslist.extend(value)  # Προσθήκη όλων των χρόνων στη λίστα
-
-    # Υπολογισμός ορίων
-    threshold_13 = machine_total_time / 3.0
-    threshold_23 = 2.0 * machine_total_time / 3.0
-
-    # Αρχικοποίηση Long (S_L) και Short (S_S)
-    S_L = []
-    S_S = []
-
-    # Αν έχω μόνο ένα στοιχείο
-    if len(timeslist) == 1:
-        S_L.append(timeslist[0])
-        #print("S_L = ", sum(S_L))
-        #print("S_S = ", sum(S_S))
-        return S_L, S_S
-
-
-    # Αν η μεγαλύτερη εργασία είναι >= 2/3 του συνολικού χρόνου
-    max_val = max(timeslist)
-    if max_val >= threshold_23 or len(timeslist) == 2:
-        S_L.append(max_val)
-        timeslist.remove(max_val)
-        S_S = timeslist  # Οι υπόλοιπες εργασίες στο S_S
-        #print("S_L = ", sum(S_L))
-        #print("S_S = ", sum(S_S))
-        return S_L, S_S
-
-
-    # Γραμμικός καταμερισμός εργασιών για 1/3 <= sum(S_L) < 2/3
-    running_sum = 0
-    for tj in timeslist:
-        if running_sum + tj < threshold_23:
-            S_L.append(tj)
-            running_sum += tj
-            if running_sum >= threshold_13:
+    times = np.asarray(jobs.get((machine,), []), dtype=np.int64)
+    long_mask = np.zeros(len(times), dtype=bool)
+    total = int(times.sum())
+
+    if len(times) == 0:
+        return times[long_mask], times
+
+    # Αν έχω ένα ή δύο στοιχεία ή η μεγαλύτερη εργασία είναι >= 2/3 του συνολικού χρόνου
+    i_max = int(np.argmax(times))
+    if len(times) <= 2 or 3 * int(times[i_max]) >= 2 * total:
+        long_mask[i_max] = True
+        return times[long_mask], times[~long_mask]
+
+    # Γραμμικός καταμερισμός εργασιών για 1/3 <= sum(S_L) < 2/3.
+    # Μέχρι το πρώτο prefix με άθροισμα >= 1/3 καμία εργασία δεν παραλείπεται, εκτός
+    # αν η τελευταία του ξεπερνά τα 2/3: τότε συνεχίζουμε με τον βρόχο από εκεί.
+    prefix = np.cumsum(times)
+    k = int(np.searchsorted(3 * prefix, total, side="left"))
+    if 3 * int(prefix[k]) < 2 * total:
+        long_mask[:k + 1] = True
+        running_sum = int(prefix[k])
+    else:
+        long_mask[:k] = True
+        running_sum = int(prefix[k - 1]) if k else 0
+        for j in range(k + 1, len(times)):
+            tj = int(times[j])
+            if 3 * (running_sum + tj) < 2 * total:
+                long_mask[j] = True
+                running_sum += tj
+                if 3 * running_sum >= total:
+                    break
+
+    # Εξασφάλιση συνθήκης sum(S_L) >= sum(S_S), δηλαδή 2 * sum(S_L) >= total.
+    # Οι "μεγάλες" εργασίες (> total/6) είναι το πολύ 5. Αν προσθέτουμε μικρές σε S_L με
+    # άθροισμα < total/2, αυτό μένει <= 2/3. Άρα αρκεί ένα υποσύνολο των μεγάλων με
+    # άθροισμα <= 2/3 που μαζί με όλες τις μικρές φτάνει το 1/2. Τέτοιο υπάρχει αν και
+    # μόνο αν υπάρχει S_L με 1/2 <= sum(S_L) <= 2/3. Αλλιώς προσθέτουμε με τη σειρά όσες
+    # εργασίες χρειάζονται, όπως παλιότερα.
+    if 2 * running_sum < total:
+        big = np.flatnonzero(6 * times > total).tolist()
+        small = np.flatnonzero(6 * times <= total)
+        small_total = int(times[small].sum())
+        for bits in range(1 << len(big)):
+            subset = [j for b, j in enumerate(big) if bits >> b & 1]
+            big_sum = int(times[subset].sum())
+            if 3 * big_sum <= 2 * total and 2 * (big_sum + small_total) >= total:
+                long_mask[:] = False
+                long_mask[subset] = True
+                running_sum, candidates = big_sum, small
                 break
+        else:
+            candidates = np.flatnonzero(~long_mask)
+        if 2 * running_sum < total:
+            added = running_sum + np.cumsum(times[candidates])
+            k = int(np.searchsorted(2 * added, total, side="left"))
+            long_mask[candidates[:k + 1]] = True
 
-    # Οι υπόλοιπες εργασίες πηγαίνουν στο S_S
-    temp_timeslist = timeslist.copy()
-    for x in S_L:
-        temp_timeslist.remove(x)
-    S_S = temp_timeslist
-
-
-    # Εξασφάλιση συνθήκης: sum(S_L) >= sum(S_S) σε περίπτωση που η S_L έχει πάνω από ένα στοιχείο
-    #if( (sum(S_L) > threshold_23) and len(S_L) == 1):
-       # return S_L, S_S
-    #else:
-    while sum(S_L) < sum(S_S):
-        # Μετακίνηση της μικρότερης εργασίας από το S_S στο S_L
-        ind = random.randint(0,len(S_S) - 1)
-        S_L.append(S_S[ind])
-        S_S.remove(S_S[ind])
-
-    #print("S_L = ", sum(S_L))
-    #print("S_S = ", sum(S_S))
-    return S_L, S_S
+    return times[long_mask], times[~long_mask]
 
 # Υπολογισμος μεταβλητων
-def calculate_partition_values(jobs):
-    """ Υπολογίζει και επιστρέφει τις βασικές τιμές L, S και p. """
+def calculate_partition_values(jobs, totals=None):
+    """
+    Υπολογίζει και επιστρέφει τις βασικές τιμές L, S και p.
+    totals: προαιρετικά τα αθροίσματα ανά σύνολο μηχανών (βλ. load_jobs_aggregated),
+    οπότε το jobs χρειάζεται μόνο τις μονομηχανιακές εργασίες.
+    """
+    if totals is None:
+        totals = {key: sum(value) for key, value in jobs.items()}
     L1, S1 = partition_jobs_goesman(jobs, 'm1')
     L2, S2 = partition_jobs_goesman(jobs, 'm2')
     L3, S3 = partition_jobs_goesman(jobs, 'm3')
 
     values = {
-        'L1': sum(L1), 'S1': sum(S1),
-        'L2': sum(L2), 'S2': sum(S2),
-        'L3': sum(L3), 'S3': sum(S3),
-        'p1': sum(jobs.get(('m1',), [])),
-        'p2': sum(jobs.get(('m2',), [])),
-        'p3': sum(jobs.get(('m3',), [])),
-        'p12': sum(jobs.get(('m1', 'm2'), [])),
-        'p13': sum(jobs.get(('m1', 'm3'), [])),
-        'p23': sum(jobs.get(('m2', 'm3'), [])),
+        'L1': int(L1.sum()), 'S1': int(S1.sum()),
+        'L2': int(L2.sum()), 'S2': int(S2.sum()),
+        'L3': int(L3.sum()), 'S3': int(S3.sum()),
+        'p1': int(totals.get(('m1',), 0)),
+        'p2': int(totals.get(('m2',), 0)),
+        'p3': int(totals.get(('m3',), 0)),
+        'p12': int(totals.get(('m1', 'm2'), 0)),
+        'p13': int(totals.get(('m1', 'm3'), 0)),
+        'p23': int(totals.get(('m2', 'm3'), 0)),
     }
     return values
 
@@ -158,8 +335,9 @@ def calculatePathValue_AB(typegraph,A_val, B_val, C_val, D_val, E_val, F_val):
     return paths
 
 # Για τα Α και Β
-def calculate_makespan_AB(typegraph, partition_values,inverted=False):
-    # Επιλογή του συγκεκριμένου μονοπατιού μόνο
+def strategy_values_AB(typegraph, partition_values):
+    """ Οι τιμές (A_val, ..., F_val) του calculatePathValue_AB για τη στρατηγική typegraph. """
+    values = None
     if typegraph == 'A1':
         values = ("A",
             partition_values['p12'], partition_values['p3'],
@@ -196,8 +374,12 @@ def calculate_makespan_AB(typegraph, partition_values,inverted=False):
             partition_values['p3'], partition_values['p13'],
             partition_values['p2'], partition_values['p12'],
         )
+    return values
+
 
-    paths = calculatePathValue_AB(*values)
+def calculate_makespan_AB(typegraph, partition_values,inverted=False):
+    # Επιλογή του συγκεκριμένου μονοπατιού μόνο
+    paths = calculatePathValue_AB(*strategy_values_AB(typegraph, partition_values))
     # Επιστροφή του μέγιστου makespan και της καλύτερης διαδρομής
     max_val, best_path = max(paths, key=lambda x: x[0])
 
@@ -223,8 +405,11 @@ def calculatePathValue_CD(A_val, B_val, C_val, D_val, E_val, F_val, G_val):
 # -----------------------------------
 # Συνάρτηση υπολογισμού για Schedule C (C12, C13, C21, C23, C31, C32) και D αντίστοιχα
 # -----------------------------------
-def calculate_makespan_CD(schedule_type, partition_values, inverted=False):
-    """ Υπολογίζει το makespan για το συγκεκριμένο schedule type (C ή D). """
+PATHS_CD = ["A->D->F", "A->C->E->F", "A->C->E->G", "B->E->F", "B->E->G"]
+
+
+def strategy_values_CD(schedule_type, partition_values, inverted=False):
+    """ Οι τιμές (A_val, ..., G_val) του calculatePathValue_CD για το schedule type (ή None). """
     L_key = 'L' if not inverted else 'S'
     S_key = 'S' if not inverted else 'L'
 
@@ -272,23 +457,31 @@ def calculate_makespan_CD(schedule_type, partition_values, inverted=False):
             partition_values[f'{S_key}3']
         )
     else:
+        return None
+    return values
+
+
+def calculate_makespan_CD(schedule_type, partition_values, inverted=False):
+    """ Υπολογίζει το makespan για το συγκεκριμένο schedule type (C ή D). """
+    values = strategy_values_CD(schedule_type, partition_values, inverted)
+    if values is None:
         return 0, "No path"
 
     # Υπολογισμός του makespan μόνο για το συγκεκριμένο μονοπάτι
     makespan_paths = calculatePathValue_CD(*values)
     max_val = max(makespan_paths)
     idx = makespan_paths.index(max_val)
-    paths_descriptions = ["A->D->F", "A->C->E->F", "A->C->E->G", "B->E->F", "B->E->G"]
 
-    return max_val, paths_descriptions[idx]
+    return max_val, PATHS_CD[idx]
 
-def find_best_strategy(strategy_group, calculate_fn, partition_values, inverted=False):
+def find_best_strategy(strategy_group, calculate_fn, partition_values, inverted=False, verbose=True):
     best_strategy = None
     best_makespan = float('inf')
 
     for strat in strategy_group:
         ms, path = calculate_fn(strat, partition_values, inverted=inverted)
-        print(f"{strat}: makespan={ms}, path={path}")
+        if verbose:
+            print(f"{strat}: makespan={ms}, path={path}")
         if ms < best_makespan:
             best_makespan = ms
             best_strategy = strat
@@ -296,39 +489,133 @@ def find_best_strategy(strategy_group, calculate_fn, partition_values, inverted=
     return best_strategy, best_makespan
 
 
-def main():
-    filename = "tasks.txt"
-    jobs = read_jobs_from_file(filename)
-    if not jobs:
-        print("Σφάλμα: Δεν βρέθηκαν έγκυρες εργασίες στο αρχείο.")
-        return
+# Στρατηγικές ανά ομάδα (schedule)
+STRATEGY_GROUPS = {
+    'A': ['A1', 'A2', 'A3'],
+    'B': ['B1', 'B2', 'B3'],
+    'C': ['C12', 'C13', 'C21', 'C23', 'C31', 'C32'],
+    'D': ['D12', 'D13', 'D21', 'D23', 'D31', 'D32']
+}
 
-    print("===== Εργασίες που φορτώθηκαν =====")
-    for k, v in jobs.items():
-        print(f"{k} -> {v}")
-        print(sum(v))
-    partition_values = calculate_partition_values(jobs)
-
-    # Ορισμός στρατηγικών ανά ομάδα
-    strategy_groups = {
-        'A': ['A1', 'A2', 'A3'],
-        'B': ['B1', 'B2', 'B3'],
-        'C': ['C12', 'C13', 'C21', 'C23', 'C31', 'C32'],
-        'D': ['D12', 'D13', 'D21', 'D23', 'D31', 'D32']
-    }
 
-    # Υπολογισμοί για κάθε ομάδα στρατηγικών
+def evaluate_strategy_groups(partition_values, verbose=True):
+    """
+    Βρίσκει την καλύτερη στρατηγική κάθε ομάδας του STRATEGY_GROUPS.
+    Επιστρέφει {schedule: (makespan, στρατηγική)}.
+    """
     results = {}
 
-    for schedule, strategies in strategy_groups.items():
-        print(f"\n===== Αποτελέσματα Schedule {schedule} =====")
+    for schedule, strategies in STRATEGY_GROUPS.items():
+        if verbose:
+            print(f"\n===== Αποτελέσματα Schedule {schedule} =====")
         calculate_fn = calculate_makespan_CD if schedule in ['C', 'D'] else calculate_makespan_AB
         inverted = (schedule == 'D')
 
-        best_strategy, best_makespan = find_best_strategy(strategies, calculate_fn, partition_values, inverted)
-        print(f"Καλύτερη στρατηγική {schedule}: {best_strategy} με makespan={best_makespan}")
+        best_strategy, best_makespan = find_best_strategy(strategies, calculate_fn, partition_values, inverted,
+                                                          verbose)
+        if verbose:
+            print(f"Καλύτερη στρατηγική {schedule}: {best_strategy} με makespan={best_makespan}")
         results[schedule] = (best_makespan, best_strategy)
 
+    return results
+
+
+# Οι 12 τιμές του calculate_partition_values, με τη σειρά των στηλών του STRATEGY_PATHS,
+# και οι 18 στρατηγικές με τη σειρά του STRATEGY_GROUPS
+PARTITION_KEYS = ('L1', 'S1', 'L2', 'S2', 'L3', 'S3', 'p1', 'p2', 'p3', 'p12', 'p13', 'p23')
+STRATEGIES = [strategy for strategies in STRATEGY_GROUPS.values() for strategy in strategies]
+
+
+def _strategy_path_matrix():
+    """
+    Πίνακας πρόσπτωσης μονοπατιών: κάθε γραμμή είναι ένα μονοπάτι μιας στρατηγικής
+    και μετρά πόσες φορές περιέχει καθεμία από τις PARTITION_KEYS. Προκύπτει από τα
+    ίδια τα strategy_values_* / calculatePathValue_*, με μοναδιαία διανύσματα στη
+    θέση των τιμών, ώστε να συμφωνεί πάντα με τους τύπους τους.
+    Επιστρέφει (matrix, offsets, names): τα μονοπάτια της STRATEGIES[k] είναι οι
+    γραμμές offsets[k]:offsets[k + 1] και names τα ονόματά τους.
+    """
+    unit = dict(zip(PARTITION_KEYS, np.eye(len(PARTITION_KEYS), dtype=np.int64)))
+    rows, offsets, names = [], [], []
+    for schedule, strategies in STRATEGY_GROUPS.items():
+        for strategy in strategies:
+            offsets.append(len(rows))
+            if schedule in ('A', 'B'):
+                for row, name in calculatePathValue_AB(*strategy_values_AB(strategy, unit)):
+                    rows.append(row)
+                    names.append(name)
+            else:
+                rows += calculatePathValue_CD(*strategy_values_CD(strategy, unit, inverted=(schedule == 'D')))
+                names += PATHS_CD
+    offsets.append(len(rows))
+    return np.array(rows), np.array(offsets), names
+
+
+STRATEGY_PATHS, STRATEGY_PATH_OFFSETS, STRATEGY_PATH_NAMES = _strategy_path_matrix()
+
+
+def evaluate_strategies_batch(values):
+    """
+    Makespan όλων των στρατηγικών για πολλά instances μαζί. values: πίνακας (n, 12)
+    με στήλες PARTITION_KEYS ή λίστα από dicts του calculate_partition_values.
+    Ένα matmul με το STRATEGY_PATHS δίνει το μήκος κάθε μονοπατιού και ένα
+    maximum.reduceat το makespan κάθε στρατηγικής, με τα ίδια αποτελέσματα με τα
+    calculate_makespan_AB/CD (και το πρώτο μέγιστο μονοπάτι σε ισοπαλία).
+    Επιστρέφει (makespans, critical): πίνακες (n, 18) με στήλες STRATEGIES, όπου
+    critical[i, k] είναι η γραμμή του κρίσιμου μονοπατιού στο STRATEGY_PATH_NAMES.
+    """
+    if not isinstance(values, np.ndarray):
+        values = [[pv[key] for key in PARTITION_KEYS] if isinstance(pv, dict) else pv for pv in values]
+    values = np.asarray(values, dtype=np.int64).reshape(-1, len(PARTITION_KEYS))
+
+    path_lengths = values @ STRATEGY_PATHS.T
+    starts = STRATEGY_PATH_OFFSETS[:-1]
+    makespans = np.maximum.reduceat(path_lengths, starts, axis=1)
+    # Πρώτο μονοπάτι κάθε στρατηγικής με μήκος ίσο με το makespan της
+    counts = np.diff(STRATEGY_PATH_OFFSETS)
+    is_max = path_lengths == np.repeat(makespans, counts, axis=1)
+    path_index = np.where(is_max, np.arange(len(STRATEGY_PATHS)), len(STRATEGY_PATHS))
+    critical = np.minimum.reduceat(path_index, starts, axis=1)
+    return makespans, critical
+
+
+def evaluate_strategy_groups_batch(values):
+    """
+    Όπως το evaluate_strategy_groups για πολλά instances (values όπως στο
+    evaluate_strategies_batch): ένα argmin ανά ομάδα, με την πρώτη στρατηγική σε
+    ισοπαλία όπως το find_best_strategy.
+    Επιστρέφει λίστα από {schedule: (makespan, στρατηγική)}, μία ανά instance.
+    """
+    makespans, _ = evaluate_strategies_batch(values)
+    results = [{} for _ in range(len(makespans))]
+    start = 0
+    for schedule, strategies in STRATEGY_GROUPS.items():
+        block = makespans[:, start:start + len(strategies)]
+        choice = block.argmin(axis=1)
+        best = block[np.arange(len(block)), choice]
+        for result, makespan, k in zip(results, best.tolist(), choice.tolist()):
+            result[schedule] = (makespan, strategies[k])
+        start += len(strategies)
+    return results
+
+
+def main():
+    filename = "tasks.txt"
+    jobs, totals = load_jobs_aggregated(filename)
+    if not totals:
+        print("Σφάλμα: Δεν βρέθηκαν έγκυρες εργασίες στο αρχείο.")
+        return
+
+    print("===== Εργασίες που φορτώθηκαν =====")
+    for k, total in totals.items():
+        if k in jobs:
+            print(f"{k} -> {len(jobs[k])} εργασίες")
+        print(f"{k} -> {total}")
+    partition_values = calculate_partition_values(jobs, totals)
+
+    # Υπολογισμοί για κάθε ομάδα στρατηγικών
+    results = evaluate_strategy_groups(partition_values)
+
     # Εύρεση συνολικά καλύτερης στρατηγικής
     best_overall_makespan = min(value[0] for value in results.values())
     best_schedules = [
@@ -0,0 +1,147 @@
+import argparse
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from goemans import calculate_partition_values, evaluate_strategy_groups_batch, parse_job_block
+
+# Αρχεία του job_generator-goemans.py: simulations/px_simsN{n}/simN{n}R{ratio}.txt
+_SIM_FILE = re.compile(r"simN(\d+)R(\d+(?:\.\d+)?)\.txt$")
+# Η γραμμή OPT που ξεκινά κάθε instance: μόνο ένας αριθμός, χωρίς ':'
+_OPT_LINE = re.compile(rb"^[ \t]*([0-9]+(?:\.[0-9]*)?)[ \t\r]*$", re.M)
+SCAN_CHUNK_BYTES = 1 << 23
+
+
+def iter_simulation_files(sim_dir):
+    """
+    Επιστρέφει με σταθερή (ταξινομημένη) σειρά (path, N, ratio) για κάθε αρχείο
+    simN{n}R{ratio}.txt κάτω από τον φάκελο sim_dir.
+    """
+    for root, dirs, files in os.walk(sim_dir):
+        dirs.sort()
+        for name in sorted(files):
+            match = _SIM_FILE.match(name)
+            if match:
+                yield os.path.join(root, name), int(match.group(1)), float(match.group(2))
+
+
+def iter_instances(path, chunk_bytes=SCAN_CHUNK_BYTES):
+    """
+    Σαρώνει ένα αρχείο simulations σε κομμάτια και βρίσκει τα instances του: κάθε
+    instance ξεκινά με τη γραμμή OPT και ακολουθούν οι εργασίες του.
+    Επιστρέφει (generator) (index, OPT, offset, length, first_line), όπου
+    [offset, offset + length) είναι τα bytes των εργασιών στο αρχείο και
+    first_line ο αριθμός της πρώτης γραμμής τους, ώστε ο worker να διαβάσει
+    μόνο το δικό του κομμάτι.
+    """
+    current = None
+    index = 0
+    base, line_num = 0, 1
+    rest = b""
+    with open(path, 'rb') as file:
+        while True:
+            chunk = file.read(chunk_bytes)
+            data = rest + chunk
+            cut = len(data) if not chunk else data.rfind(b"\n") + 1
+            pos = 0
+            for match in _OPT_LINE.finditer(data, 0, cut):
+                line_num += data.count(b"\n", pos, match.start())
+                pos = match.start()
+                if current is not None:
+                    opt, offset, first_line = current
+                    yield index, opt, offset, base + match.start() - offset, first_line
+                    index += 1
+                body = match.end() + 1 if data[match.end():match.end() + 1] == b"\n" else match.end()
+                current = (float(match.group(1)), base + body, line_num + 1)
+            line_num += data.count(b"\n", pos, cut)
+            base += cut
+            rest = data[cut:]
+            if not chunk:
+                break
+    if current is not None:
+        opt, offset, first_line = current
+        yield index, opt, offset, base - offset, first_line
+
+
+def iter_tasks(sim_dir):
+    """ (path, N, ratio, index, OPT, offset, length, first_line) για κάθε instance του sim_dir. """
+    for path, n, ratio in iter_simulation_files(sim_dir):
+        for instance in iter_instances(path):
+            yield (path, n, ratio) + instance
+
+
+def format_result(ratio, n, results, opt, sec):
+    """
+    Μία γραμμή αποτελεσμάτων στη μορφή που διαβάζουν τα plot-goemans-*.py:
+    ratio=..., N=..., A=..(A1), B=..(B1), C=..(C12), D=..(D12), bestMakespan=..(X),
+    OPT=..., error=..., time=... (error = (bestMakespan - OPT) / OPT, time σε ms).
+    """
+    best_schedule = min(results, key=lambda schedule: results[schedule][0])
+    best_makespan, best_strategy = results[best_schedule]
+    error = (best_makespan - opt) / opt if opt else 0.0
+    groups = ", ".join(f"{schedule}={makespan}({strategy})" for schedule, (makespan, strategy) in results.items())
+    return (f"ratio={ratio}, N={n}, {groups}, bestMakespan={best_makespan}({best_strategy}), "
+            f"OPT={opt:.1f}, error={error:.6f}, time={sec * 1000:.4f}")
+
+
+def evaluate_instance(task):
+    """
+    Αξιολογεί ένα instance (εκτελείται σε worker process): διαβάζει μόνο τα bytes
+    του, τα επεξεργάζεται με το parse_job_block και βρίσκει την καλύτερη στρατηγική
+    κάθε ομάδας. Χρονομετρούνται ο διαχωρισμός και η αξιολόγηση των στρατηγικών
+    (όχι η ανάγνωση του αρχείου).
+    Επιστρέφει τη γραμμή αποτελεσμάτων (format_result).
+    """
+    path, n, ratio, index, opt, offset, length, first_line = task
+    with open(path, 'rb') as file:
+        file.seek(offset)
+        data = file.read(length)
+    jobs_single, totals = parse_job_block(data, first_line)
+    jobs = {key: np.concatenate(parts) for key, parts in jobs_single.items()}
+
+    start = time.perf_counter()
+    partition_values = calculate_partition_values(jobs, totals)
+    results = evaluate_strategy_groups_batch([partition_values])[0]
+    sec = time.perf_counter() - start
+    return format_result(ratio, n, results, opt, sec)
+
+
+def run_batch(sim_dir, output_file, workers=None):
+    """
+    Αξιολογεί όλα τα instances του sim_dir σε pool από workers processes
+    (προεπιλογή: όλοι οι πυρήνες) και γράφει μία γραμμή ανά instance. Το πολύ
+    2 * workers instances περιμένουν να λυθούν κάθε στιγμή και η σειρά των
+    γραμμών ακολουθεί τη σειρά των αρχείων.
+    Επιστρέφει το πλήθος των instances που αξιολογήθηκαν.
+    """
+    workers = workers or os.cpu_count() or 1
+    count = 0
+    with open(output_file, 'w', encoding='utf-8') as out, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for task in iter_tasks(sim_dir):
+            pending.append(pool.submit(evaluate_instance, task))
+            if len(pending) >= 2 * workers:
+                out.write(pending.popleft().result() + "\n")
+                count += 1
+        while pending:
+            out.write(pending.popleft().result() + "\n")
+            count += 1
+
+    return count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batch αξιολόγηση των στρατηγικών goemans σε φάκελο simulations.")
+    parser.add_argument("sim_dir", nargs="?", default="simulations")
+    parser.add_argument("-o", "--output", default="all_results.txt")
+    parser.add_argument("-w", "--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    start_time = time.time()
+    evaluated = run_batch(args.sim_dir, args.output, args.workers)
+    print(f"[INFO] Evaluated {evaluated} instances in {time.time() - start_time:.2f} sec -> {args.output}")
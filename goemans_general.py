@@ -0,0 +1,239 @@
+import argparse
+import time
+
+from goemans import load_jobs_aggregated, partition_jobs_goesman
+
+
+def build_blocks(totals, jobs=None, split_single=False):
+    """
+    Ομαδοποιεί τις εργασίες ανά σύνολο μηχανών: κάθε σύνολο γίνεται ένα block που
+    εκτελείται συνεχόμενα σε όλες τις μηχανές του, με διάρκεια το άθροισμα των χρόνων
+    του (totals: {tuple μηχανών: συνολικός χρόνος}, π.χ. από το load_jobs_aggregated).
+    Με split_single=True και jobs (οι μονομηχανιακοί χρόνοι) κάθε μονομηχανιακό σύνολο
+    χωρίζεται, όπως στο goemans.py, σε δύο blocks L και S με το partition_jobs_goesman.
+    Επιστρέφει (machines, blocks): machines η ταξινομημένη λίστα μηχανών και blocks
+    λίστα από (όνομα, tuple δεικτών μηχανών, διάρκεια), για blocks με θετική διάρκεια.
+    """
+    machines = sorted({machine for key in totals for machine in key})
+    index = {machine: i for i, machine in enumerate(machines)}
+    blocks = []
+    for key in sorted(totals, key=lambda key: (len(key), key)):
+        used = tuple(index[machine] for machine in key)
+        if split_single and jobs is not None and len(key) == 1 and key in jobs:
+            long_part, short_part = partition_jobs_goesman(jobs, key[0])
+            parts = [(f"L({key[0]})", int(long_part.sum())), (f"S({key[0]})", int(short_part.sum()))]
+        else:
+            parts = [("(" + " ".join(key) + ")", int(totals[key]))]
+        blocks += [(name, used, duration) for name, duration in parts if duration > 0]
+    return machines, blocks
+
+
+def machine_loads(machines, blocks):
+    """ Συνολικός χρόνος ανά μηχανή. """
+    loads = [0] * len(machines)
+    for _, used, duration in blocks:
+        for i in used:
+            loads[i] += duration
+    return loads
+
+
+def block_dag(machines, blocks, order):
+    """
+    DAG προτεραιοτήτων για μια σειρά blocks: κάθε block εξαρτάται από το αμέσως
+    προηγούμενο (στη σειρά) block κάθε μηχανής του.
+    Επιστρέφει predecessors[b] (λίστα blocks, χωρίς επαναλήψεις).
+    """
+    last = [None] * len(machines)
+    predecessors = [[] for _ in blocks]
+    for b in order:
+        predecessors[b] = sorted({last[i] for i in blocks[b][1] if last[i] is not None})
+        for i in blocks[b][1]:
+            last[i] = b
+    return predecessors
+
+
+def dag_makespan(machines, blocks, order):
+    """
+    Makespan μιας σειράς blocks ως το μακρύτερο μονοπάτι του block_dag: κάθε block
+    ξεκινά όταν τελειώσουν όλοι οι προκάτοχοί του.
+    Επιστρέφει (makespan, start, critical_path) με start[b] τον χρόνο έναρξης κάθε
+    block και critical_path τα blocks του μακρύτερου μονοπατιού.
+    """
+    predecessors = block_dag(machines, blocks, order)
+    start, finish, via = [0] * len(blocks), [0] * len(blocks), [None] * len(blocks)
+    for b in order:
+        for a in predecessors[b]:
+            if finish[a] > start[b]:
+                start[b], via[b] = finish[a], a
+        finish[b] = start[b] + blocks[b][2]
+
+    if not order:
+        return 0, start, []
+    b = max(order, key=lambda b: finish[b])
+    makespan = finish[b]
+    path = []
+    while b is not None:
+        path.append(b)
+        b = via[b]
+    return makespan, start, path[::-1]
+
+
+def conflict_cliques(machines, blocks, limit=64):
+    """
+    Σύνολα blocks που ανά δύο έχουν κοινή μηχανή, άρα εκτελούνται το ένα μετά το άλλο:
+    τα blocks κάθε μηχανής, και όσα ακόμη προκύπτουν με άπληστη επέκταση από κάθε block
+    (με φθίνουσα διάρκεια, π.χ. (m1 m2), (m2 m3), (m1 m3)), το πολύ limit επιπλέον.
+    Επιστρέφει λίστα από tuples δεικτών blocks.
+    """
+    cliques = {tuple(b for b in range(len(blocks)) if i in blocks[b][1]) for i in range(len(machines))}
+    conflicts = [{c for c in range(len(blocks)) if set(blocks[b][1]) & set(blocks[c][1])} for b in range(len(blocks))]
+    by_duration = sorted(range(len(blocks)), key=lambda b: (-blocks[b][2], b))
+    extra = set()
+    for b in by_duration:
+        clique = [b]
+        for c in by_duration:
+            if c != b and all(c in conflicts[a] for a in clique):
+                clique.append(c)
+        clique = tuple(sorted(clique))
+        if clique not in cliques and not any(set(clique) <= set(other) for other in cliques):
+            extra.add(clique)
+        if len(extra) >= limit:
+            break
+    return sorted(cliques) + sorted(extra)
+
+
+def _greedy_orders(blocks):
+    """ Αρχικές σειρές για το incumbent: περισσότερες μηχανές πρώτα, μεγαλύτερη διάρκεια πρώτα κ.λπ. """
+    indices = range(len(blocks))
+    yield sorted(indices, key=lambda b: (-len(blocks[b][1]), -blocks[b][2], b))
+    yield sorted(indices, key=lambda b: (-blocks[b][2], b))
+    yield sorted(indices, key=lambda b: (-blocks[b][2] * len(blocks[b][1]), b))
+
+
+def search_block_order(machines, blocks, time_limit=10.0, memo_limit=1000000):
+    """
+    Branch and bound για τη σειρά των blocks με το ελάχιστο makespan.
+      - Το πρόγραμμα μιας σειράς είναι το μακρύτερο μονοπάτι του block_dag, δηλαδή
+        κάθε block ξεκινά όταν ελευθερωθούν όλες οι μηχανές του.
+      - Αρκούν σειρές με μη φθίνοντες χρόνους έναρξης (σε ισοπαλία, αύξοντα δείκτη):
+        σε ένα βέλτιστο πρόγραμμα η σειρά κατά χρόνο έναρξης δίνει ίδιο ή μικρότερο
+        makespan, οπότε τα υπόλοιπα παιδιά κόβονται.
+      - Κάτω όριο: για κάθε σύνολο του conflict_cliques (τα blocks κάθε μηχανής και
+        άλλα σύνολα blocks που δεν επικαλύπτονται ανά δύο), τα blocks που απομένουν
+        ξεκινούν μετά το τέλος όσων έχουν ήδη μπει και μετά τον τρέχοντα χρόνο
+        έναρξης, και εκτελούνται το ένα μετά το άλλο. Στη ρίζα είναι το μέγιστο
+        φορτίο μηχανής ή συνόλου.
+      - Καταστάσεις με ίδια blocks και ίδια διαθεσιμότητα μηχανών που έχουν ήδη
+        εξεταστεί με μικρότερο (ή ίσο) χρόνο έναρξης παραλείπονται.
+    Επιστρέφει (makespan, order, optimal): optimal=False αν τελείωσε ο χρόνος
+    (time_limit σε δευτερόλεπτα, None για χωρίς όριο) πριν την απόδειξη.
+    """
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    n = len(blocks)
+    cliques = conflict_cliques(machines, blocks)
+    cliques_of = [[k for k, clique in enumerate(cliques) if b in clique] for b in range(n)]
+    remaining = [sum(blocks[b][2] for b in clique) for clique in cliques]
+    lower = max(remaining, default=0)
+
+    best_makespan, best_order = float('inf'), []
+    for order in _greedy_orders(blocks):
+        makespan = dag_makespan(machines, blocks, order)[0]
+        if makespan < best_makespan:
+            best_makespan, best_order = makespan, order
+    if best_makespan <= lower:
+        return best_makespan, best_order, True
+
+    clique_end = [0] * len(cliques)
+    avail = [0] * len(machines)
+    order = []
+    memo = {}
+    state = {"timed_out": False, "nodes": 0}
+
+    def bound(t):
+        return max((max(end, t) + r if r else end) for end, r in zip(clique_end, remaining))
+
+    def search(placed, t_prev, prev):
+        nonlocal best_makespan, best_order
+        if len(order) == n:
+            makespan = max(avail)
+            if makespan < best_makespan:
+                best_makespan, best_order = makespan, order[:]
+            return
+        state["nodes"] += 1
+        if deadline is not None and state["nodes"] % 256 == 0 and time.perf_counter() > deadline:
+            state["timed_out"] = True
+        if state["timed_out"]:
+            return
+
+        key = (placed, tuple(avail))
+        seen = memo.get(key)
+        if seen is not None and seen <= (t_prev, prev):
+            return
+        if seen is not None or len(memo) < memo_limit:
+            memo[key] = (t_prev, prev)
+
+        children = []
+        for b in range(n):
+            if placed >> b & 1:
+                continue
+            t = max(avail[i] for i in blocks[b][1])
+            if t < t_prev or (t == t_prev and b < prev):
+                continue
+            children.append((t, -blocks[b][2], b))
+        children.sort()
+
+        for t, _, b in children:
+            used, duration = blocks[b][1], blocks[b][2]
+            saved = [avail[i] for i in used]
+            saved_end = [clique_end[k] for k in cliques_of[b]]
+            for i in used:
+                avail[i] = t + duration
+            for k in cliques_of[b]:
+                clique_end[k] = max(clique_end[k], t + duration)
+                remaining[k] -= duration
+            if bound(t) < best_makespan:
+                order.append(b)
+                search(placed | (1 << b), t, b)
+                order.pop()
+            for i, a in zip(used, saved):
+                avail[i] = a
+            for k, end in zip(cliques_of[b], saved_end):
+                clique_end[k] = end
+                remaining[k] += duration
+            if best_makespan <= lower or state["timed_out"]:
+                return
+
+    search(0, 0, -1)
+    return best_makespan, best_order, best_makespan <= lower or not state["timed_out"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dedicated machines scheduling για οποιοδήποτε πλήθος μηχανών.")
+    parser.add_argument("filename", nargs="?", default="tasks.txt")
+    parser.add_argument("--split-single", action="store_true",
+                        help="χωρισμός των μονομηχανιακών εργασιών σε L/S blocks όπως στο goemans.py")
+    parser.add_argument("--time-limit", type=float, default=10.0)
+    args = parser.parse_args()
+
+    jobs, totals = load_jobs_aggregated(args.filename)
+    if not totals:
+        print("Σφάλμα: Δεν βρέθηκαν έγκυρες εργασίες στο αρχείο.")
+        return
+
+    machines, blocks = build_blocks(totals, jobs, args.split_single)
+    print(f"Μηχανές: {machines}, blocks: {len(blocks)}")
+    start_time = time.time()
+    makespan, order, optimal = search_block_order(machines, blocks, args.time_limit)
+    _, start, path = dag_makespan(machines, blocks, order)
+
+    print(f"Κάτω όριο (μέγιστο φορτίο μηχανής): {max(machine_loads(machines, blocks))}")
+    print(f"Makespan: {makespan} ({'βέλτιστη σειρά blocks' if optimal else 'όριο χρόνου, καλύτερη που βρέθηκε'})")
+    for b in order:
+        name, _, duration = blocks[b]
+        print(f"{name}: [{start[b]}, {start[b] + duration})")
+    print("Κρίσιμο μονοπάτι: " + "->".join(blocks[b][0] for b in path))
+    print(f"Χρόνος: {time.time() - start_time:.4f} sec")
+
+
+if __name__ == "__main__":
+    main()
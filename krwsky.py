@@ -1,31 +1,163 @@
 
+import argparse
 import heapq
+import os
+import random
 import time
+import warnings
+from array import array
+from bisect import bisect_left, bisect_right, insort
 from collections import defaultdict
-from itertools import permutations
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, permutations
 
+import numpy as np
 
-def read_edges_from_file(filename):
+from krwsky_stats import GraphStats
+
+
+def read_edges_from_file(filename, use_cache=True):
     """
     Διαβάζει τις ακμές από ένα αρχείο.
     :param filename: Το όνομα του αρχείου εισόδου.
+    :param use_cache: Χρήση του cache filename + ".npz" (βλ. load_edge_arrays).
     :return: Λίστα ακμών (edge_id, node1, node2, weight).
+    Οι γραμμές με λάθος μορφή αναφέρονται και παραλείπονται (βλ. parse_edge_file).
+    """
+    node1, node2, weight = load_edge_arrays(filename, use_cache)
+    return list(zip(range(len(weight)), node1.tolist(), node2.tolist(), weight.tolist()))
+
+# Μέγεθος κομματιού ανάγνωσης και μέγιστο πλήθος λαθών γραμμών που τυπώνονται
+EDGE_CHUNK_BYTES = 1 << 23
+MAX_REPORTED_LINES = 10
+
+def _line_field_counts(chunk):
+    """ Πλήθος πεδίων (λέξεων) ανά γραμμή ενός κομματιού, με πράξεις NumPy πάνω στα bytes. """
+    buf = np.frombuffer(chunk, dtype=np.uint8)
+    newline = buf == 10
+    blank = newline | (buf == 32) | (buf == 9) | (buf == 13) | (buf == 11) | (buf == 12)
+    token_start = ~blank
+    token_start[1:] &= blank[:-1]
+    line_of = np.cumsum(newline, dtype=np.int32) - newline
+    return np.bincount(line_of[token_start], minlength=int(newline.sum()) + 1)
+
+def _has_lone_sign(chunk):
+    """ True αν κάποιο πεδίο είναι μόνο πρόσημο ("-", "+"), που το np.fromstring διαβάζει ως 0. """
+    if b"-" not in chunk and b"+" not in chunk:
+        return False
+    buf = np.frombuffer(chunk, dtype=np.uint8)
+    blank = buf <= 32
+    sign = np.flatnonzero((buf == 43) | (buf == 45))
+    before = np.where(sign > 0, blank[np.maximum(sign - 1, 0)], True)
+    after = np.where(sign + 1 < len(buf), blank[np.minimum(sign + 1, len(buf) - 1)], True)
+    return bool(np.any(before & after))
+
+def _parse_edge_lines(chunk, first_line, bad_lines):
+    """
+    Αργή διαδρομή για κομμάτι με λάθη: γραμμή-γραμμή, κρατώντας τις σωστές
+    και καταγράφοντας τις λάθος στο bad_lines ως (αριθμός γραμμής, κείμενο).
+    Επιστρέφει τις τιμές των σωστών γραμμών σε array('q').
+    """
+    values = array('q')
+    for line_no, line in enumerate(chunk.split(b"\n"), first_line):
+        parts = line.split()
+        if not parts:
+            continue
+        try:
+            if len(parts) != 3:
+                raise ValueError
+            values.extend([int(part) for part in parts])
+        except ValueError:
+            bad_lines.append((line_no, line.decode(errors="replace").strip()))
+    return values
+
+def parse_edge_file(filename):
+    """
+    Μαζική ανάγνωση αρχείου ακμών "node1 node2 weight": το αρχείο διαβάζεται σε
+    κομμάτια των EDGE_CHUNK_BYTES, και κάθε κομμάτι μετατρέπεται με μία κλήση
+    του np.fromstring σε πίνακα, αφού ελεγχθεί (με NumPy) ότι κάθε μη κενή
+    γραμμή έχει 3 πεδία. Μόνο κομμάτια με λάθη διαβάζονται γραμμή-γραμμή: οι
+    λάθος γραμμές τυπώνονται (οι πρώτες MAX_REPORTED_LINES) και παραλείπονται,
+    χωρίς να διακόπτεται η ανάγνωση. Οι κενές γραμμές αγνοούνται.
+    Επιστρέφει (node1, node2, weight) ως πίνακες np.int64· η ακμή i έχει edge_id = i.
     """
-    edges = []
+    pieces = []
+    bad_lines = []
     try:
-        with open(filename, 'r') as file:
-            edge_id = 0
-            for line in file:
-                parts = line.split()
-                if len(parts) == 3:
-                    node1, node2, weight = map(int, parts)
-                    edges.append((edge_id, node1, node2, weight))
-                    edge_id += 1
+        with open(filename, 'rb') as file:
+            rest, line_no = b"", 1
+            while True:
+                block = file.read(EDGE_CHUNK_BYTES)
+                if block:
+                    cut = block.rfind(b"\n") + 1
+                    if cut == 0:
+                        rest += block
+                        continue
+                    chunk, rest = rest + block[:cut], block[cut:]
+                else:
+                    chunk, rest = rest, b""
+                if chunk:
+                    counts = _line_field_counts(chunk)
+                    parsed = None
+                    if np.all((counts == 0) | (counts == 3)) and not _has_lone_sign(chunk):
+                        # Το np.fromstring σταματά (με warning) στο πρώτο πεδίο που δεν είναι ακέραιος
+                        with warnings.catch_warnings():
+                            warnings.simplefilter("error", DeprecationWarning)
+                            try:
+                                parsed = np.fromstring(chunk, dtype=np.int64, sep=" ")
+                            except (ValueError, DeprecationWarning):
+                                pass
+                        if parsed is not None and len(parsed) != 3 * np.count_nonzero(counts):
+                            parsed = None
+                    if parsed is None:
+                        parsed = np.frombuffer(_parse_edge_lines(chunk, line_no, bad_lines), dtype=np.int64)
+                    pieces.append(parsed)
+                    line_no += chunk.count(b"\n")
+                if not block:
+                    break
     except FileNotFoundError:
         print(f"Το αρχείο {filename} δεν βρέθηκε.")
-    except ValueError:
-        print(f"Σφάλμα μορφής στο αρχείο {filename}. Βεβαιωθείτε ότι κάθε γραμμή έχει την εξής μορφή: node1 node2 weight")
-    return edges
+
+    if bad_lines:
+        print(f"Σφάλμα μορφής σε {len(bad_lines)} γραμμές του {filename} (παραλείφθηκαν). "
+              f"Κάθε γραμμή πρέπει να έχει την εξής μορφή: node1 node2 weight")
+        for line_no, text in bad_lines[:MAX_REPORTED_LINES]:
+            print(f"   γραμμή {line_no}: {text!r}")
+
+    columns = np.concatenate(pieces).reshape(-1, 3) if pieces else np.zeros((0, 3), dtype=np.int64)
+    return columns[:, 0].copy(), columns[:, 1].copy(), columns[:, 2].copy()
+
+def load_edge_arrays(filename, use_cache=True):
+    """
+    Όπως το parse_edge_file, αλλά με cache: οι πίνακες αποθηκεύονται στο
+    filename + ".npz" μαζί με το μέγεθος και τον χρόνο τροποποίησης του αρχείου,
+    και οι επόμενες αναγνώσεις του ίδιου (αμετάβλητου) αρχείου φορτώνουν
+    απευθείας τους πίνακες.
+    Επιστρέφει (node1, node2, weight) ως πίνακες np.int64.
+    """
+    cache_path = filename + ".npz"
+    try:
+        stat = os.stat(filename)
+    except FileNotFoundError:
+        print(f"Το αρχείο {filename} δεν βρέθηκε.")
+        return tuple(np.zeros(0, dtype=np.int64) for _ in range(3))
+    source = np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+
+    if use_cache and os.path.exists(cache_path):
+        try:
+            with np.load(cache_path) as cached:
+                if np.array_equal(cached["source"], source):
+                    return cached["node1"], cached["node2"], cached["weight"]
+        except (OSError, KeyError, ValueError):
+            pass
+
+    node1, node2, weight = parse_edge_file(filename)
+    if use_cache:
+        try:
+            np.savez(cache_path, node1=node1, node2=node2, weight=weight, source=source)
+        except OSError as e:
+            print(f"Δεν ήταν δυνατή η αποθήκευση του cache {cache_path}: {e}")
+    return node1, node2, weight
 
 def sort_edges_longest_first(edges):
     """
@@ -75,7 +207,200 @@ def brute_force_makespan(edges, neighbors):
             min_makespan = min(min_makespan, makespan)
     return min_makespan
 
+def branch_and_bound_makespan(edges, time_limit=None, memo_limit=1000000):
+    """
+    Ακριβής υπολογισμός του ελάχιστου makespan με branch and bound. Το
+    αποτέλεσμα είναι το ίδιο με το brute_force_makespan (το καλύτερο
+    first-fit πρόγραμμα πάνω σε όλες τις διατάξεις των ακμών), αλλά:
+      - αρχική λύση είναι το LF, και η αναζήτηση δοκιμάζει τις ακμές με τη σειρά του LF
+      - εξετάζονται μόνο διατάξεις όπου οι χρόνοι έναρξης είναι αύξοντες (και
+        σε ισοπαλία οι δείκτες): αν ξανατρέξει το first-fit με τις ακμές
+        ταξινομημένες κατά χρόνο έναρξης, καμία ακμή δεν ξεκινά αργότερα, οπότε
+        κάποια βέλτιστη λύση έχει αυτή τη μορφή
+      - πανομοιότυπες ακμές (ίδια άκρα και βάρος) τοποθετούνται με σταθερή σειρά
+      - κάτω φράγματα δίνουν οι ομάδες ακμών που ανά δύο έχουν κοινό κόμβο (οι
+        ακμές ενός κόμβου και οι ακμές ενός τριγώνου), που εκτελούνται
+        αναγκαστικά η μία μετά την άλλη: στη ρίζα το συνολικό τους βάρος (άρα
+        και το max weighted degree) και σε κάθε μερικό πρόγραμμα ένα preemptive
+        φράγμα (βλ. bound)
+      - καταστάσεις (τοποθετημένες ακμές, timelines κόμβων) που έχουν ήδη
+        εξερευνηθεί με χαλαρότερο περιορισμό σειράς δεν εξερευνώνται ξανά
+        (έως memo_limit καταστάσεις)
+    time_limit: όριο χρόνου σε δευτερόλεπτα (None = χωρίς όριο).
+    Επιστρέφει:
+     - makespan: το καλύτερο makespan που βρέθηκε
+     - start_times: {edge_id: start} της καλύτερης λύσης
+     - optimal: True αν η αναζήτηση ολοκληρώθηκε ή η λύση πιάνει το κάτω φράγμα
+    """
+    # Οι ακμές μηδενικού βάρους ξεκινούν πάντα στο 0 και δεν επηρεάζουν τις υπόλοιπες
+    zero_times = {edge_id: 0 for (edge_id, _, _, weight) in edges if weight <= 0}
+    work = sorted((e for e in edges if e[3] > 0), key=lambda e: (-e[3], e[0]))
+    if not work:
+        return 0, zero_times, True
+
+    labels = {}
+    for (_, node1, node2, _) in work:
+        labels.setdefault(node1, len(labels))
+        labels.setdefault(node2, len(labels))
+    ends = [(labels[node1], labels[node2]) for (_, node1, node2, _) in work]
+    weights = [weight for (_, _, _, weight) in work]
+    m, n = len(work), len(labels)
+
+    # Ομάδες ακμών που ανά δύο συγκρούονται: οι πρώτες n είναι οι ακμές κάθε κόμβου,
+    # ακολουθούν τα τρίγωνα (χωρίς βρόχους) που έχουν ακμές και στις τρεις πλευρές
+    groups = [[] for _ in range(n)]
+    for i, (a, b) in enumerate(ends):
+        groups[a].append(i)
+        if b != a:
+            groups[b].append(i)
+    pairs = defaultdict(list)
+    for i, (a, b) in enumerate(ends):
+        if a != b:
+            pairs[min(a, b), max(a, b)].append(i)
+    for (a, b) in list(pairs):
+        for c in range(b + 1, n):
+            if (a, c) in pairs and (b, c) in pairs:
+                groups.append(pairs[a, b] + pairs[a, c] + pairs[b, c])
+    edge_groups = [[] for _ in range(m)]
+    remaining = []
+    for g, members in enumerate(groups):
+        remaining.append(sum(weights[i] for i in members))
+        for i in members:
+            edge_groups[i].append(g)
+    lower = max(remaining)
+
+    # twin[i]: η προηγούμενη πανομοιότυπη ακμή, που πρέπει να έχει τοποθετηθεί πριν από την i
+    twin, last_seen = [-1] * m, {}
+    for i, (a, b) in enumerate(ends):
+        key = (min(a, b), max(a, b), weights[i])
+        twin[i] = last_seen.get(key, -1)
+        last_seen[key] = i
+
+    # Αρχική λύση: LF
+    timelines = [NodeTimeline() for _ in range(n)]
+    best_starts = [0] * m
+    for i, (a, b) in enumerate(ends):
+        best_starts[i] = earliest_common_gap(timelines[a], timelines[b], weights[i])
+        timelines[a].add(best_starts[i], best_starts[i] + weights[i])
+        timelines[b].add(best_starts[i], best_starts[i] + weights[i])
+    best = max(s + w for s, w in zip(best_starts, weights))
+
+    timelines = [NodeTimeline() for _ in range(n)]
+    starts = [0] * m
+    seen = {}
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    state = {"placed": 0, "visits": 0, "timed_out": False}
+
+    def bound(t):
+        """
+        Κάτω φράγμα όταν όλες οι υπόλοιπες ακμές ξεκινούν από το t και μετά
+        (inf αν κάποια ακμή δεν μπορεί πλέον να τοποθετηθεί από το t και μετά).
+        Για κάθε ακμή, η νωρίτερη έναρξη είναι το πρώτο κοινό κενό μετά το t.
+        Σε κάθε ομάδα, οι υπόλοιπες ακμές εκτελούνται με preemption εκτός των
+        διαστημάτων των ήδη τοποθετημένων ακμών της, με αυτές τις νωρίτερες
+        εκκινήσεις ως release times.
+        """
+        placed = state["placed"]
+        release = [None] * m
+        for i in range(m):
+            if placed >> i & 1:
+                continue
+            a, b = ends[i]
+            first = earliest_common_gap(timelines[a], timelines[b], weights[i])
+            # Το κενό πριν από το t δεν μπορεί να κλείσει από ακμές που ξεκινούν από το t και μετά
+            if first + weights[i] <= t:
+                return float('inf')
+            release[i] = first if first >= t else earliest_common_gap(timelines[a], timelines[b], weights[i], t)
+
+        result = 0
+        for g, members in enumerate(groups):
+            if remaining[g] == 0:
+                continue
+            if g < n:
+                busy = timelines[g]
+            else:
+                busy = NodeTimeline()
+                for i in members:
+                    if placed >> i & 1:
+                        busy.add(starts[i], starts[i] + weights[i])
+            cur = 0
+            for r, w in sorted((release[i], weights[i]) for i in members if not placed >> i & 1):
+                cur = max(cur, r)
+                while w > 0:
+                    k = bisect_right(busy.ends, cur)
+                    if k < len(busy) and busy.starts[k] <= cur:
+                        cur = busy.ends[k]
+                        continue
+                    step = min(w, busy.starts[k] - cur) if k < len(busy) else w
+                    cur += step
+                    w -= step
+            result = max(result, cur)
+        return result
+
+    def search(depth, prev, t_prev, makespan):
+        nonlocal best, best_starts
+        if depth == m:
+            if makespan < best:
+                best, best_starts = makespan, starts[:]
+            return
+        state["visits"] += 1
+        if deadline is not None and state["visits"] % 256 == 0 and time.perf_counter() > deadline:
+            state["timed_out"] = True
+        if state["timed_out"]:
+            return
+
+        placed = state["placed"]
+        # Η ίδια κατάσταση με χαλαρότερο περιορισμό (t_prev, prev) έχει ήδη εξερευνηθεί πλήρως
+        key = (placed, tuple(tuple(t.starts) + tuple(t.ends) for t in timelines))
+        explored = seen.get(key)
+        if explored is not None and explored <= (t_prev, prev):
+            return
+        if explored is not None or len(seen) < memo_limit:
+            seen[key] = (t_prev, prev)
+
+        for i in range(m):
+            if placed >> i & 1 or (twin[i] >= 0 and not placed >> twin[i] & 1):
+                continue
+            a, b = ends[i]
+            weight = weights[i]
+            t = earliest_common_gap(timelines[a], timelines[b], weight)
+            if t < t_prev or (t == t_prev and i < prev):
+                continue
+            new_makespan = max(makespan, t + weight)
+            if new_makespan >= best:
+                continue
+
+            touched = (a,) if a == b else (a, b)
+            saved = [(timelines[node].starts[:], timelines[node].ends[:]) for node in touched]
+            state["placed"] = placed | (1 << i)
+            starts[i] = t
+            for node in touched:
+                timelines[node].add(t, t + weight)
+            for g in edge_groups[i]:
+                remaining[g] -= weight
+
+            if bound(t) < best:
+                search(depth + 1, i, t, new_makespan)
+
+            state["placed"] = placed
+            for node, (saved_starts, saved_ends) in zip(touched, saved):
+                timelines[node].starts, timelines[node].ends = saved_starts, saved_ends
+            for g in edge_groups[i]:
+                remaining[g] += weight
+            if best <= lower or state["timed_out"]:
+                return
+
+    if best > lower:
+        search(0, -1, 0, 0)
+
+    start_times = dict(zero_times)
+    for (edge_id, _, _, _), s in zip(work, best_starts):
+        start_times[edge_id] = s
+    return best, start_times, best <= lower or not state["timed_out"]
+
 def is_binomial_graph(edges):
+    if isinstance(edges, CSRGraph):
+        return len(np.unique(edges.weight)) == 2
     weights = set(weight for (_, _, _, weight) in edges)
     return len(weights) == 2
 
@@ -95,33 +420,575 @@ def build_neighbors(edges):
         edges_info[edge_id] = (node1, node2, weight)
     return neighbors, edges_info
 
+class CSRGraph:
+    """
+    Συμπαγής αναπαράσταση του γραφήματος σε πίνακες NumPy, με πυκνούς δείκτες
+    κόμβων 0..n-1 και ακμών 0..m-1 (η θέση της ακμής στο αρχικό edges):
+      - nodes[i]: η αρχική ετικέτα του κόμβου i
+      - edge_ids, src, dst, weight: στήλες των ακμών (src/dst είναι δείκτες κόμβων)
+      - indptr, adj_edge, adj_node: οι ακμές του κόμβου i είναι οι
+        adj_edge[indptr[i]:indptr[i + 1]], με άλλο άκρο τα αντίστοιχα adj_node,
+        με την ίδια σειρά όπως στο neighbors του build_neighbors
+    Κάθε ακμή κοστίζει ~40 bytes, έναντι εκατοντάδων για τα tuples και τα
+    dicts των edges/neighbors/edges_info.
+    """
+    __slots__ = ("nodes", "edge_ids", "src", "dst", "weight", "indptr", "adj_edge", "adj_node")
+
+    def __init__(self, node1, node2, weight, edge_ids=None):
+        node1 = np.asarray(node1, dtype=np.int64)
+        node2 = np.asarray(node2, dtype=np.int64)
+        m = len(node1)
+        # Οι δύο άκρες κάθε ακμής διαδοχικά, ώστε η σειρά στο CSR να είναι η σειρά του build_neighbors
+        ends = np.stack((node1, node2), axis=1).ravel()
+        self.nodes, ends = np.unique(ends, return_inverse=True)
+        index_dtype = np.int32 if max(len(self.nodes), m) < 2 ** 31 else np.int64
+        ends = ends.astype(index_dtype)
+        self.src, self.dst = ends[0::2], ends[1::2]
+        self.weight = np.asarray(weight, dtype=np.int64)
+        self.edge_ids = np.arange(m, dtype=np.int64) if edge_ids is None else np.asarray(edge_ids, dtype=np.int64)
+
+        order = np.argsort(ends, kind="stable")
+        self.indptr = np.zeros(len(self.nodes) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(ends, minlength=len(self.nodes)), out=self.indptr[1:])
+        self.adj_edge = (order // 2).astype(index_dtype)
+        self.adj_node = ends[order ^ 1]
+
+    @classmethod
+    def from_edges(cls, edges):
+        """ Δημιουργεί CSRGraph από λίστα ακμών (edge_id, node1, node2, weight). """
+        if not edges:
+            return cls([], [], [], [])
+        edge_ids, node1, node2, weight = zip(*edges)
+        return cls(node1, node2, weight, edge_ids)
+
+    def __len__(self):
+        """ Πλήθος ακμών. """
+        return len(self.weight)
+
+    @property
+    def num_nodes(self):
+        return len(self.nodes)
+
+    def lf_order(self):
+        """ Δείκτες ακμών κατά φθίνον βάρος και αύξον edge_id, όπως το sort_edges_longest_first. """
+        return np.lexsort((self.edge_ids, -self.weight))
+
+    def degrees(self):
+        """ Πλήθος ακμών ανά κόμβο (οι βρόχοι μετρούν δύο φορές). """
+        return np.diff(self.indptr)
+
+    def weighted_degrees(self):
+        """ Άθροισμα βαρών ανά κόμβο (οι βρόχοι μετρούν δύο φορές). """
+        n = len(self.nodes)
+        return (np.bincount(self.src, weights=self.weight, minlength=n)
+                + np.bincount(self.dst, weights=self.weight, minlength=n)).astype(np.int64)
+
+    def start_times_dict(self, start, order=None):
+        """ Μετατρέπει πίνακα χρόνων έναρξης σε {edge_id: start}, με τη σειρά του order. """
+        if order is None:
+            order = np.arange(len(self.weight))
+        return dict(zip(self.edge_ids[order].tolist(), start[order].tolist()))
+
+class NodeTimeline:
+    """
+    Τα busy intervals ενός κόμβου ως ταξινομημένα, ξένα μεταξύ τους διαστήματα
+    [starts[i], ends[i]). Διαστήματα που εφάπτονται ή επικαλύπτονται
+    συγχωνεύονται κατά την εισαγωγή, οπότε starts και ends είναι και τα δύο
+    αύξοντα και η αναζήτηση γίνεται με bisect.
+    """
+    __slots__ = ("starts", "ends")
+
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+
+    def __len__(self):
+        return len(self.starts)
+
+    def conflict_end(self, x, weight):
+        """
+        Αν το [x, x + weight) επικαλύπτεται με busy διάστημα, επιστρέφει το
+        τέλος του πρώτου τέτοιου διαστήματος, αλλιώς None.
+        """
+        i = bisect_right(self.ends, x)
+        if i < len(self.starts) and self.starts[i] < x + weight:
+            return self.ends[i]
+        return None
+
+    def add(self, start, end):
+        """
+        Προσθέτει το busy διάστημα [start, end), συγχωνεύοντάς το με όσα αγγίζει.
+        Επιστρέφει ό,τι χρειάζεται το undo για να αναιρέσει την προσθήκη.
+        """
+        if end <= start:
+            return None
+        i = bisect_left(self.ends, start)
+        j = bisect_right(self.starts, end)
+        token = (i, self.starts[i:j], self.ends[i:j])
+        if i < j:
+            start = min(start, self.starts[i])
+            end = max(end, self.ends[j - 1])
+        self.starts[i:j] = [start]
+        self.ends[i:j] = [end]
+        return token
+
+    def undo(self, token):
+        """ Αναιρεί μια προσθήκη (οι προσθήκες αναιρούνται με αντίστροφη σειρά). """
+        if token is not None:
+            i, starts, ends = token
+            self.starts[i:i + 1] = starts
+            self.ends[i:i + 1] = ends
+
+def earliest_common_gap(timeline_a, timeline_b, weight, earliest=0):
+    """
+    Το μικρότερο x >= earliest ώστε το [x, x + weight) να είναι ελεύθερο και στους
+    δύο κόμβους. Σε κάθε βήμα το x πηδά στο τέλος του διαστήματος που το
+    εμποδίζει, άρα το κόστος είναι O(log deg) ανά άλμα χωρίς ταξινόμηση.
+    Δίνει το ίδιο αποτέλεσμα με το first-fit πάνω στα ταξινομημένα
+    (start, weight) των γειτονικών ακμών.
+    """
+    x = earliest
+    if weight <= 0:
+        return x
+    while True:
+        end = timeline_a.conflict_end(x, weight)
+        if end is None:
+            end = timeline_b.conflict_end(x, weight)
+            if end is None:
+                return x
+        x = end
+
 def schedule_edges(edges, neighbors, edges_info):
     """
-    Υλοποίηση του LF scheduling, χρησιμοποιώντας neighbors.
-    neighbors[node] = [(neighbor, edge_id, weight)]
+    Υλοποίηση του LF scheduling: κάθε ακμή, με τη σειρά του edges, ξεκινά στο
+    πρώτο κοινό κενό μήκους weight των δύο άκρων της. Οι busy χρόνοι κάθε
+    κόμβου κρατούνται σε NodeTimeline που ενημερώνεται σταδιακά, οπότε δεν
+    χρειάζεται σάρωση και ταξινόμηση των γειτονικών ακμών για κάθε ακμή.
+    Το neighbors διατηρείται στην υπογραφή για συμβατότητα.
+    Για CSRGraph χρησιμοποιείται το schedule_edges_csr (neighbors = order).
+
+    Παράλληλες ακμές με το ίδιο βάρος (bundle, π.χ. από το split_number του
+    job_generator_krwsky.py) προγραμματίζονται η μία μετά την άλλη: όταν μια
+    ακμή του bundle μπήκε στο x, δεν υπήρχε κοινό κενό μήκους weight πριν από
+    το x και το [x, x + weight) είναι πλέον busy, άρα η επόμενη ακμή του
+    bundle ξεκινά στο x + weight ή αργότερα. Η αναζήτηση συνεχίζει από εκεί
+    αντί να ξαναπερνά όλο το timeline, με ίδια αποτελέσματα για κάθε σειρά.
     """
+    if isinstance(edges, CSRGraph):
+        return schedule_edges_csr(edges, neighbors)
+
     start_times = {}
+    timelines = defaultdict(NodeTimeline)
+    bundle_end = {}
 
     for (edge_id, node1, node2, weight) in edges:
-        scheduled_adj_times = []
-        for node in (node1, node2):
-            for (nbr, nbr_edge_id, nbr_weight) in neighbors[node]:
-                if nbr_edge_id in start_times:
-                    nbr_start = start_times[nbr_edge_id]
-                    scheduled_adj_times.append((nbr_start, nbr_weight))
-
-        scheduled_adj_times.sort(key=lambda x: x[0])
-        term = 0
-        for (t_e_sj, l_e_sj) in scheduled_adj_times:
-            if term + weight <= t_e_sj:
-                break
-            else:
-                term = max(term, t_e_sj + l_e_sj)
-
+        timeline1, timeline2 = timelines[node1], timelines[node2]
+        bundle = (node1, node2, weight) if node1 <= node2 else (node2, node1, weight)
+        term = earliest_common_gap(timeline1, timeline2, weight, bundle_end.get(bundle, 0))
         start_times[edge_id] = term
+        if weight > 0:
+            bundle_end[bundle] = term + weight
+        timeline1.add(term, term + weight)
+        timeline2.add(term, term + weight)
 
     return start_times
 
+def schedule_edges_csr(graph, order=None):
+    """
+    LF scheduling πάνω σε CSRGraph. order: η σειρά των ακμών
+    (προεπιλογή: graph.lf_order()).
+    Τα bundles παράλληλων ακμών ίδιου βάρους χειρίζονται όπως στο schedule_edges.
+    Επιστρέφει πίνακα np.int64 με τον χρόνο έναρξης κάθε ακμής (ανά θέση ακμής).
+    """
+    if order is None:
+        order = graph.lf_order()
+    start = np.zeros(len(graph), dtype=np.int64)
+    timelines = [NodeTimeline() for _ in range(graph.num_nodes)]
+    bundle_end = {}
+
+    src, dst, weight = graph.src.tolist(), graph.dst.tolist(), graph.weight.tolist()
+    for e in order.tolist():
+        weight_e, node1, node2 = weight[e], src[e], dst[e]
+        timeline1, timeline2 = timelines[node1], timelines[node2]
+        bundle = (node1, node2, weight_e) if node1 <= node2 else (node2, node1, weight_e)
+        term = earliest_common_gap(timeline1, timeline2, weight_e, bundle_end.get(bundle, 0))
+        start[e] = term
+        if weight_e > 0:
+            bundle_end[bundle] = term + weight_e
+        timeline1.add(term, term + weight_e)
+        timeline2.add(term, term + weight_e)
+
+    return start
+
+def improve_lf(edges, time_limit=1.0, seed=0, max_moves=None):
+    """
+    Anytime βελτίωση του LF με τοπική αναζήτηση πάνω στη σειρά των ακμών,
+    ξεκινώντας από τη σειρά του sort_edges_longest_first. Κινήσεις:
+      - ανταλλαγή δύο ακμών ίδιου βάρους (κοντινές θέσεις της σειράς)
+      - μετακίνηση νωρίτερα στη σειρά μιας ακμής του κρίσιμου μονοπατιού: μιας
+        ακμής που τελειώνει στο makespan ή μιας ακμής που την καθυστερεί
+        (κοινός κόμβος, τελειώνει ακριβώς όταν εκείνη ξεκινά)
+    Η σειρά ορίζεται από ένα ακέραιο κλειδί ανά ακμή (με κενά ανάμεσα, ώστε μια
+    μετακίνηση να αλλάζει μόνο το κλειδί της ακμής) και μετά από μια κίνηση το
+    first-fit ενημερώνεται όπως στο IncrementalLF: ξαναϋπολογίζονται μόνο οι
+    ακμές των dirty κόμβων που ακολουθούν στη σειρά, όχι όλο το υπόλοιπο της
+    σειράς. Οι ακμές ξαναϋπολογίζονται με τη σειρά, άρα ο χρόνος τους είναι
+    τελικός και η κίνηση απορρίπτεται μόλις κάποια ξεπεράσει το makespan.
+    Μια απορριφθείσα κίνηση αναιρείται από το log των χρόνων που άλλαξαν.
+    Κινήσεις που δεν χειροτερεύουν το makespan γίνονται δεκτές.
+    Οι θέσεις επιλέγονται κυρίως κοντά στο τέλος της σειράς (εκθετική απόσταση
+    με μέση τιμή max(32, m / 32)), όπου οι αλλαγές επηρεάζουν λιγότερες ακμές,
+    και ως κρίσιμη ακμή παίρνεται η τελευταία στη σειρά από όσες τελειώνουν
+    στο makespan. Οι ακμές που καθυστερούν μια ακμή βρίσκονται από ευρετήριο
+    (κόμβος, τέλος) -> ακμές, σε O(βαθμού).
+    time_limit: χρονικό όριο σε δευτερόλεπτα, max_moves: προαιρετικό όριο κινήσεων.
+    Η αναζήτηση σταματά νωρίτερα αν το makespan φτάσει το max weighted degree.
+    Επιστρέφει:
+     - makespan: το καλύτερο makespan που βρέθηκε
+     - start_times: {edge_id: start} της καλύτερης λύσης
+     - order: οι ακμές με τη σειρά που δίνει την καλύτερη λύση
+     - moves: πλήθος κινήσεων που δοκιμάστηκαν
+    """
+    rng = random.Random(seed)
+    # Οι ακμές αναφέρονται με τη θέση τους στη σειρά LF (slot)
+    edge = sort_edges_longest_first(edges)
+    m = len(edge)
+    if m == 0:
+        return 0, {}, [], 0
+
+    load = defaultdict(int)
+    for (_, node1, node2, weight) in edge:
+        load[node1] += weight
+        load[node2] += weight
+    lower = max(load.values())
+    scale = max(32, m // 32)
+    gap = 1 << 32
+
+    order = list(range(m))
+    key = [s * gap for s in range(m)]
+    incident = defaultdict(list)
+    start = [0] * m
+    # Ακμές ανά (κόμβος, τέλος) και ανά τέλος
+    ending = defaultdict(set)
+    by_end = defaultdict(set)
+
+    def renumber():
+        incident.clear()
+        for p, s in enumerate(order):
+            key[s] = p * gap
+            _, node1, node2, _ = edge[s]
+            for node in {node1, node2}:
+                incident[node].append((key[s], s))
+
+    def set_start(s, t):
+        _, node1, node2, weight = edge[s]
+        for index, end in ((ending, (node1, start[s] + weight)), (ending, (node2, start[s] + weight)),
+                           (by_end, start[s] + weight)):
+            slots = index.get(end)
+            if slots is not None:
+                slots.discard(s)
+                if not slots:
+                    del index[end]
+        start[s] = t
+        ending[node1, t + weight].add(s)
+        ending[node2, t + weight].add(s)
+        by_end[t + weight].add(s)
+
+    def timeline_before(node, entry):
+        """ Το timeline του κόμβου με τις ακμές του πριν από το entry, και η θέση του entry. """
+        timeline = NodeTimeline()
+        entries = incident[node]
+        position = bisect_left(entries, entry)
+        for (_, s) in entries[:position]:
+            timeline.add(start[s], start[s] + edge[s][3])
+        return timeline, position
+
+    def propagate(first_key, nodes, moved, limit, log):
+        """
+        Ξαναϋπολογίζει τις ακμές από το first_key και μετά που επηρεάζονται από
+        αλλαγή στους κόμβους nodes (όπως το IncrementalLF._propagate). Οι
+        προηγούμενοι χρόνοι όσων αλλάζουν μπαίνουν στο log.
+        Επιστρέφει False μόλις κάποια ακμή τελειώσει μετά το limit.
+        """
+        timelines, frontier = {}, []
+
+        def make_dirty(node, timeline, position):
+            timelines[node] = timeline
+            if position < len(incident[node]):
+                heapq.heappush(frontier, (incident[node][position], node, position))
+
+        for node in set(nodes):
+            make_dirty(node, *timeline_before(node, (first_key, -1)))
+
+        last = None
+        while frontier:
+            entry, node, position = heapq.heappop(frontier)
+            if position + 1 < len(incident[node]):
+                heapq.heappush(frontier, (incident[node][position + 1], node, position + 1))
+            if entry == last:
+                continue
+            last = entry
+
+            s = entry[1]
+            _, node1, node2, weight = edge[s]
+            other = node2 if node == node1 else node1
+            if other in timelines:
+                other_timeline, clean = timelines[other], False
+            else:
+                (other_timeline, other_position), clean = timeline_before(other, entry), True
+
+            t = earliest_common_gap(timelines[node], other_timeline, weight)
+            changed = s in moved or start[s] != t
+            if start[s] != t:
+                log.append((s, start[s]))
+                set_start(s, t)
+                if t + weight > limit:
+                    return False
+            timelines[node].add(t, t + weight)
+            if other != node:
+                other_timeline.add(t, t + weight)
+            if clean and changed:
+                make_dirty(other, other_timeline, other_position + 1)
+        return True
+
+    timelines = defaultdict(NodeTimeline)
+    for s, (_, node1, node2, weight) in enumerate(edge):
+        t = earliest_common_gap(timelines[node1], timelines[node2], weight)
+        timelines[node1].add(t, t + weight)
+        timelines[node2].add(t, t + weight)
+        set_start(s, t)
+    del timelines
+    renumber()
+
+    def late_position(limit):
+        """ Θέση < limit, κυρίως κοντά στο limit. """
+        return max(0, limit - 1 - int(rng.expovariate(1.0 / scale)))
+
+    def move_key(s, new_key):
+        _, node1, node2, _ = edge[s]
+        for node in {node1, node2}:
+            entries = incident[node]
+            entries.pop(bisect_left(entries, (key[s], s)))
+            insort(entries, (new_key, s))
+        key[s] = new_key
+
+    current = max(by_end)
+    best = current
+    best_order, best_start = list(order), list(start)
+
+    deadline = time.perf_counter() + time_limit
+    moves = 0
+    while best > lower and (max_moves is None or moves < max_moves):
+        if moves % 64 == 0 and time.perf_counter() > deadline:
+            break
+        moves += 1
+
+        if rng.random() < 0.5:
+            # Ανταλλαγή με την επόμενη ακμή ίδιου βάρους μέσα σε ένα μικρό παράθυρο
+            i = late_position(m)
+            same = [j for j in range(i + 1, min(m, i + 32)) if edge[order[j]][3] == edge[order[i]][3]]
+            if not same:
+                continue
+            j = rng.choice(same)
+            a, b = order[i], order[j]
+            key_a, key_b = key[a], key[b]
+
+            def apply():
+                move_key(a, -1)
+                move_key(b, key_a)
+                move_key(a, key_b)
+                order[i], order[j] = b, a
+
+            def revert():
+                move_key(a, -1)
+                move_key(b, key_b)
+                move_key(a, key_a)
+                order[i], order[j] = a, b
+            first_key, moved = key_a, (a, b)
+        else:
+            # Ακμή του κρίσιμου μονοπατιού: από την τελευταία ακμή που τελειώνει στο
+            # makespan, μερικά βήματα πίσω στις ακμές που την καθυστερούν
+            c = max(by_end[current], key=key.__getitem__)
+            while rng.random() < 0.5:
+                _, node1, node2, _ = edge[c]
+                blockers = [k for node in {node1, node2} for k in ending.get((node, start[c]), ())
+                            if key[k] < key[c]]
+                if not blockers:
+                    break
+                c = rng.choice(blockers)
+            j = order.index(c)
+            if j == 0:
+                continue
+            i = late_position(j)
+            low = key[order[i - 1]] if i else key[order[0]] - 2 * gap
+            if key[order[i]] - low < 2:
+                renumber()
+                low = key[order[i - 1]]
+            old_key, new_key = key[c], (low + key[order[i]]) // 2
+
+            def apply():
+                move_key(c, new_key)
+                order.insert(i, order.pop(j))
+
+            def revert():
+                move_key(c, old_key)
+                order.insert(j, order.pop(i))
+            first_key, moved = new_key, (c,)
+
+        apply()
+        nodes = [node for k in moved for node in edge[k][1:3]]
+        log = []
+        if propagate(first_key, nodes, moved, current, log):
+            if current not in by_end:
+                current = max(by_end)
+            if current < best:
+                best = current
+                best_order, best_start = list(order), list(start)
+        else:
+            for s, t in reversed(log):
+                set_start(s, t)
+            revert()
+
+    best_starts = {edge[s][0]: best_start[s] for s in best_order}
+    return best, best_starts, [edge[s] for s in best_order], moves
+
+class IncrementalLF:
+    """
+    LF scheduling που ενημερώνεται σταδιακά με add_edge/remove_edge, με
+    αποτέλεσμα πάντα ίδιο με το schedule_edges πάνω στο sort_edges_longest_first
+    όλων των τρεχουσών ακμών.
+      - Η σειρά LF ορίζεται από το κλειδί (-weight, edge_id) κάθε ακμής.
+      - incident[node]: τα κλειδιά των ακμών του κόμβου, ταξινομημένα.
+    Μια αλλαγή στο κλειδί k επηρεάζει μόνο τα άκρα της ακμής (dirty κόμβοι).
+    Οι ακμές μετά το k επισκέπτονται με τη σειρά LF μέσω ενός heap με την
+    επόμενη ακμή κάθε dirty κόμβου, και μόνο αυτές ξαναϋπολογίζονται. Αν ο
+    χρόνος έναρξης μιας ακμής αλλάξει, γίνονται dirty και τα δύο άκρα της,
+    αλλιώς το άλλο άκρο μένει ανεπηρέαστο. Ακμές χωρίς dirty άκρο δεν
+    αγγίζονται. Το timeline ενός κόμβου τη στιγμή k χτίζεται από τους χρόνους
+    των ακμών του με κλειδί < k.
+    """
+
+    def __init__(self, edges=()):
+        self.edges = {}
+        self.start = {}
+        self.order = []
+        self.incident = defaultdict(list)
+        self._ends = []
+        edges = sort_edges_longest_first(edges)
+        neighbors, edges_info = build_neighbors(edges)
+        start_times = schedule_edges(edges, neighbors, edges_info)
+        for (e_id, node1, node2, weight) in edges:
+            if e_id in self.edges:
+                raise ValueError(f"Διπλό edge_id {e_id}")
+            self.edges[e_id] = (node1, node2, weight)
+            self.order.append((-weight, e_id))
+            for node in {node1, node2}:
+                self.incident[node].append((-weight, e_id))
+            self._set_start(e_id, start_times[e_id])
+
+    def __len__(self):
+        return len(self.edges)
+
+    @property
+    def start_times(self):
+        """ {edge_id: start} με τη σειρά LF. """
+        return {e_id: self.start[e_id] for (_, e_id) in self.order}
+
+    @property
+    def makespan(self):
+        # Heap με lazy διαγραφή: παλιές εγγραφές (αφαιρεμένη ακμή ή άλλος χρόνος) πετιούνται
+        while self._ends:
+            neg_end, e_id, s_time = self._ends[0]
+            if self.start.get(e_id) == s_time:
+                return -neg_end
+            heapq.heappop(self._ends)
+        return 0
+
+    def _set_start(self, e_id, s_time):
+        self.start[e_id] = s_time
+        heapq.heappush(self._ends, (-(s_time + self.edges[e_id][2]), e_id, s_time))
+        if len(self._ends) > 4 * len(self.edges) + 64:
+            self._ends = [(-(s + self.edges[e][2]), e, s) for e, s in self.start.items()]
+            heapq.heapify(self._ends)
+
+    def add_edge(self, edge_id, node1, node2, weight):
+        """ Προσθέτει ακμή. Επιστρέφει το πλήθος των ακμών που ξαναϋπολογίστηκαν. """
+        if edge_id in self.edges:
+            raise ValueError(f"Διπλό edge_id {edge_id}")
+        key = (-weight, edge_id)
+        self.edges[edge_id] = (node1, node2, weight)
+        insort(self.order, key)
+        for node in {node1, node2}:
+            insort(self.incident[node], key)
+        return self._propagate(key, (node1, node2), new_edge=edge_id)
+
+    def remove_edge(self, edge_id):
+        """ Αφαιρεί ακμή. Επιστρέφει το πλήθος των ακμών που ξαναϋπολογίστηκαν. """
+        node1, node2, weight = self.edges.pop(edge_id)
+        key = (-weight, edge_id)
+        del self.start[edge_id]
+        self.order.pop(bisect_left(self.order, key))
+        for node in {node1, node2}:
+            keys = self.incident[node]
+            keys.pop(bisect_left(keys, key))
+        return self._propagate(key, (node1, node2))
+
+    def _timeline_before(self, node, key):
+        """ Το timeline του κόμβου με τις ακμές του που έχουν κλειδί < key, και η θέση του key. """
+        timeline = NodeTimeline()
+        keys = self.incident[node]
+        position = bisect_left(keys, key)
+        for (neg_weight, e_id) in keys[:position]:
+            timeline.add(self.start[e_id], self.start[e_id] - neg_weight)
+        return timeline, position
+
+    def _propagate(self, key, nodes, new_edge=None):
+        """
+        Ξαναϋπολογίζει τις ακμές μετά το key που επηρεάζονται από αλλαγή στους κόμβους nodes.
+        timelines[node]: το timeline κάθε dirty κόμβου μέχρι την τρέχουσα ακμή, και
+        next_key[node]: η επόμενη ακμή του που δεν έχει ακόμη εξεταστεί.
+        """
+        timelines, frontier = {}, []
+
+        def make_dirty(node, timeline, position):
+            timelines[node] = timeline
+            if position < len(self.incident[node]):
+                heapq.heappush(frontier, (self.incident[node][position], node, position))
+
+        for node in set(nodes):
+            make_dirty(node, *self._timeline_before(node, key))
+
+        recomputed, last_key = 0, None
+        while frontier:
+            edge_key, node, position = heapq.heappop(frontier)
+            if position + 1 < len(self.incident[node]):
+                heapq.heappush(frontier, (self.incident[node][position + 1], node, position + 1))
+            if edge_key == last_key:
+                # Η ακμή έχει ήδη ξαναϋπολογιστεί από το άλλο (dirty) άκρο της
+                continue
+            last_key = edge_key
+
+            e_id = edge_key[1]
+            node1, node2, weight = self.edges[e_id]
+            other = node2 if node == node1 else node1
+            if other in timelines:
+                other_timeline, clean = timelines[other], False
+            else:
+                (other_timeline, other_position), clean = self._timeline_before(other, edge_key), True
+
+            recomputed += 1
+            t = earliest_common_gap(timelines[node], other_timeline, weight)
+            changed = e_id == new_edge or self.start[e_id] != t
+            if changed:
+                self._set_start(e_id, t)
+            timelines[node].add(t, t + weight)
+            if other != node:
+                other_timeline.add(t, t + weight)
+            if clean and changed:
+                make_dirty(other, other_timeline, other_position + 1)
+
+        return recomputed
+
 def node_busy_intervals(start_times, edges_info):
     """
     Υπολογίζει τα busy intervals για κάθε κόμβο.
@@ -176,32 +1043,190 @@ def intersect_intervals(intervals_a, intervals_b):
             j += 1
     return result
 
-def calculate_delays(edges, start_times, edges_info):
+class ScheduleIndex:
     """
-    Υπολογίζει delay για κάθε ακμή.
+    Ευρετήριο ενός προγράμματος start_times, που χτίζεται μία φορά και
+    μοιράζεται στην ανάλυση μετά το LF (calculate_delays, generate_diagnostic_graph):
+      - busy[node]: NodeTimeline με τα (συγχωνευμένα) busy intervals του κόμβου
+      - first_start[node], last_start[node]: ο μικρότερος και ο μεγαλύτερος
+        χρόνος έναρξης ακμής του κόμβου
+    Για ακέραιους χρόνους τα timelines όλων των κόμβων αντιγράφονται και σε
+    συνεχόμενους πίνακες NumPy (ένα τμήμα ανά κόμβο), ώστε τα ερωτήματα
+    ελεύθερου χρόνου να απαντώνται όλα μαζί.
     """
-    busy = node_busy_intervals(start_times, edges_info)
-    delays = {}
-    for (e_id, u, v, w) in edges:
-        s_e = start_times[e_id]
-        if s_e == 0:
-            delays[e_id] = 0
-            continue
+    __slots__ = ("busy", "first_start", "last_start", "integral", "_columns")
 
-        u_available = find_availability_intervals(busy[u], s_e)
-        v_available = find_availability_intervals(busy[v], s_e)
-        common_available = intersect_intervals(u_available, v_available)
+    # Μέγιστο πλήθος όρων αθροίσματος ανά ομάδα ερωτημάτων στο common_free_times
+    CHUNK = 1 << 20
 
-        delay = 0
-        for (st, en) in common_available:
-            end_int = min(en, s_e)
-            if end_int > st:
-                delay += (end_int - st)
-        delays[e_id] = delay
+    def __init__(self, start_times, edges_info):
+        self.busy = defaultdict(NodeTimeline)
+        self.first_start = {}
+        self.last_start = {}
+        self.integral = True
+        self._columns = None
+        # Με τις ακμές σε χρονική σειρά οι εισαγωγές γίνονται σχεδόν πάντα στο τέλος
+        for e_id, s_time in sorted(start_times.items(), key=lambda item: item[1]):
+            n1, n2, w = edges_info[e_id]
+            if not (isinstance(s_time, (int, np.integer)) and isinstance(w, (int, np.integer))):
+                self.integral = False
+            for node in (n1, n2):
+                self.busy[node].add(s_time, s_time + w)
+                self.first_start.setdefault(node, s_time)
+                self.last_start[node] = s_time
+
+    def common_free_time(self, u, v, until_times):
+        """
+        Για κάθε x του until_times (αύξουσα σειρά), ο χρόνος στο [0, x) όπου
+        είναι ελεύθεροι και ο u και ο v. Ένα πέρασμα συγχώνευσης των δύο
+        timelines εξυπηρετεί όλα τα x.
+        """
+        timeline_u, timeline_v = self.busy[u], self.busy[v]
+        intervals = heapq.merge(zip(timeline_u.starts, timeline_u.ends),
+                                zip(timeline_v.starts, timeline_v.ends))
+        nxt = next(intervals, None)
+        covered, block_start, block_end = 0, 0, 0
+        result = []
+        for x in until_times:
+            while nxt is not None and nxt[0] < x:
+                if nxt[0] > block_end:
+                    covered += block_end - block_start
+                    block_start, block_end = nxt
+                else:
+                    block_end = max(block_end, nxt[1])
+                nxt = next(intervals, None)
+            result.append(x - covered - max(0, min(block_end, x) - block_start))
+        return result
+
+    def columns(self):
+        """
+        Τα timelines ως πίνακες NumPy (None αν οι χρόνοι δεν είναι ακέραιοι):
+          - index_of: {node: δείκτης}, ptr: το τμήμα του κόμβου i είναι [ptr[i], ptr[i + 1])
+          - starts, ends: τα busy intervals, covered[k]: άθροισμα μηκών των πρώτων k
+          - span: μεγαλύτερο τέλος + 1, key_start/key_end = δείκτης * span + starts/ends
+            (αύξοντα σε όλο τον πίνακα, για ένα searchsorted για όλους τους κόμβους).
+            Οι χρόνοι των ερωτημάτων περιορίζονται στο span - 1 πριν την κωδικοποίηση
+            (μετά το τελευταίο τέλος ο busy χρόνος δεν αλλάζει), ώστε να μην
+            πέφτουν στο τμήμα του επόμενου κόμβου.
+        """
+        if self._columns is None and self.integral:
+            nodes = list(self.busy)
+            counts = [len(self.busy[node]) for node in nodes]
+            ptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+            np.cumsum(counts, out=ptr[1:])
+            starts = np.fromiter(chain.from_iterable(self.busy[node].starts for node in nodes), np.int64, ptr[-1])
+            ends = np.fromiter(chain.from_iterable(self.busy[node].ends for node in nodes), np.int64, ptr[-1])
+            span = int(ends.max()) + 1 if len(ends) else 1
+            if len(nodes) * span >= 2 ** 62:
+                self.integral = False
+                return None
+            owner = np.repeat(np.arange(len(nodes), dtype=np.int64), counts)
+            covered = np.zeros(len(starts) + 1, dtype=np.int64)
+            np.cumsum(ends - starts, out=covered[1:])
+            self._columns = ({node: i for i, node in enumerate(nodes)}, ptr, starts, ends,
+                             owner * span + starts, owner * span + ends, covered, span)
+        return self._columns
+
+    def _busy_before(self, node, y):
+        """ Busy χρόνος κάθε κόμβου node[i] στο [0, y[i]) (πίνακες δεικτών κόμβων και χρόνων). """
+        _, ptr, starts, ends, _, key_end, covered, span = self._columns
+        k = np.searchsorted(key_end, node * span + np.minimum(y, span - 1), side='right')
+        partial = np.maximum(0, y - starts[np.minimum(k, len(starts) - 1)])
+        return covered[k] - covered[ptr[node]] + np.where(k < ptr[node + 1], partial, 0)
+
+    def common_free_times(self, us, vs, xs):
+        """
+        Για κάθε i, ο χρόνος στο [0, xs[i]) όπου είναι ελεύθεροι και ο us[i] και ο vs[i]:
+            x - busy_u(x) - busy_v(x) + |busy_u ∩ busy_v ∩ [0, x)|
+        Τα busy_u(x) είναι ένα searchsorted. Η τομή αθροίζεται πάνω στα
+        intervals του άκρου με τα λιγότερα intervals, ως busy χρόνος του άλλου
+        άκρου μέσα σε καθένα: τα ερωτήματα ομαδοποιούνται ανά ζεύγος κόμβων
+        με αύξον x, οπότε κάθε ζεύγος χρειάζεται ένα αθροιστικό άθροισμα.
+        Όλα γίνονται με πράξεις NumPy σε κομμάτια έως CHUNK όρων.
+        Επιστρέφει λίστα (για μη ακέραιους χρόνους: ένα common_free_time ανά ζεύγος).
+        """
+        columns = self.columns()
+        if columns is None:
+            by_pair = defaultdict(list)
+            for i, (u, v, x) in enumerate(zip(us, vs, xs)):
+                by_pair[u, v].append((x, i))
+            result = [0] * len(xs)
+            for (u, v), queries in by_pair.items():
+                queries.sort()
+                for (_, i), free in zip(queries, self.common_free_time(u, v, [x for (x, _) in queries])):
+                    result[i] = free
+            return result
+
+        index_of, ptr, starts, ends, key_start, _, _, span = columns
+        x = np.asarray(xs, dtype=np.int64)
+        if not len(starts) or not len(x):
+            return x.tolist()
+        u = np.array([index_of[node] for node in us], dtype=np.int64)
+        v = np.array([index_of[node] for node in vs], dtype=np.int64)
+        counts = np.diff(ptr)
+        swap = counts[u] > counts[v]
+        a, b = np.where(swap, v, u), np.where(swap, u, v)
 
+        order = np.lexsort((x, b, a))
+        a, b, x = a[order], b[order], x[order]
+        # j: πλήθος intervals του a που ξεκινούν πριν από το x. Τα j - 1 πρώτα
+        # τελειώνουν πριν από το x, το τελευταίο ίσως όχι.
+        j = np.searchsorted(key_start, a * span + np.minimum(x, span - 1), side='left') - ptr[a]
+        last = np.minimum(ptr[a] + np.maximum(j - 1, 0), len(starts) - 1)
+        inter = np.where(j > 0, self._busy_before(b, np.minimum(ends[last], x)) - self._busy_before(b, starts[last]), 0)
+
+        new_pair = np.ones(len(x), dtype=bool)
+        new_pair[1:] = (a[1:] != a[:-1]) | (b[1:] != b[:-1])
+        pair_first = np.flatnonzero(new_pair)
+        pair_of = np.cumsum(new_pair) - 1
+        pair_end = np.append(pair_first[1:], len(x))
+        # Όροι ανά ζεύγος: τα πλήρη intervals του a πριν από το τελευταίο (μεγαλύτερο) x του ζεύγους
+        terms = np.maximum(j[pair_end - 1] - 1, 0)
+        terms_end = np.cumsum(terms)
+
+        g0 = 0
+        while g0 < len(pair_first):
+            limit = (terms_end[g0 - 1] if g0 else 0) + self.CHUNK
+            g1 = max(g0 + 1, int(np.searchsorted(terms_end, limit, side='right')))
+            k = terms[g0:g1]
+            offsets = np.zeros(len(k) + 1, dtype=np.int64)
+            np.cumsum(k, out=offsets[1:])
+            term_pair = np.repeat(np.arange(g0, g1), k)
+            elem = ptr[a[pair_first[term_pair]]] + np.arange(offsets[-1]) - offsets[term_pair - g0]
+            other = b[pair_first[term_pair]]
+            sums = np.zeros(offsets[-1] + 1, dtype=np.int64)
+            np.cumsum(self._busy_before(other, ends[elem]) - self._busy_before(other, starts[elem]), out=sums[1:])
+
+            q0, q1 = pair_first[g0], pair_end[g1 - 1]
+            base = offsets[pair_of[q0:q1] - g0]
+            inter[q0:q1] += sums[base + np.maximum(j[q0:q1] - 1, 0)] - sums[base]
+            g0 = g1
+
+        free = x - self._busy_before(a, x) - self._busy_before(b, x) + inter
+        result = np.empty(len(x), dtype=np.int64)
+        result[order] = free
+        return result.tolist()
+
+def calculate_delays(edges, start_times, edges_info, index=None):
+    """
+    Υπολογίζει delay για κάθε ακμή: τον χρόνο πριν από την έναρξή της όπου
+    ήταν ελεύθερα και τα δύο άκρα της.
+    Όλες οι ακμές απαντώνται μαζί από τα timelines του ScheduleIndex (index:
+    προαιρετικά ένα ήδη χτισμένο ευρετήριο), αντί για νέο υπολογισμό
+    διαθεσιμότητας ανά ακμή.
+    """
+    if index is None:
+        index = ScheduleIndex(start_times, edges_info)
+
+    queries = [(e_id, u, v, start_times[e_id]) for (e_id, u, v, w) in edges if start_times[e_id] != 0]
+    free = index.common_free_times([u for (_, u, _, _) in queries], [v for (_, _, v, _) in queries],
+                                   [s_e for (_, _, _, s_e) in queries])
+    delays = dict.fromkeys((e_id for (e_id, _, _, _) in edges), 0)
+    for (e_id, _, _, _), delay in zip(queries, free):
+        delays[e_id] = delay
     return delays
 
-def calculate_demand_schedule_and_delay(edges, start_times, edges_info, binomial):
+def calculate_demand_schedule_and_delay(edges, start_times, edges_info, binomial, index=None):
     """
     Αν το γράφημα είναι binomial, θεωρούμε ότι δεν υπάρχουν καθυστερήσεις.
     """
@@ -210,25 +1235,60 @@ def calculate_demand_schedule_and_delay(edges, start_times, edges_info, binomial
         is_demand_schedule = True
         return is_demand_schedule, delays
 
-    delays = calculate_delays(edges, start_times, edges_info)
+    delays = calculate_delays(edges, start_times, edges_info, index)
     is_demand_schedule = all(d == 0 for d in delays.values())
     return is_demand_schedule, delays
 
 def evaluate_ratio(edges, start_times, edges_info, max_weighted_degree):
     """
     Υπολογισμός LF(G)/OPT(G) ≈ makespan / max_weighted_degree
+    Για CSRGraph το start_times είναι ο πίνακας του schedule_edges_csr.
     """
-    if not edges or not start_times:
-        return 0, 0
-
-    makespan = max(start_times[e_id] + edges_info[e_id][2] for (e_id, _, _, _) in edges)
+    if isinstance(edges, CSRGraph):
+        if not len(edges):
+            return 0, 0
+        makespan = int((start_times + edges.weight).max())
+    else:
+        if not edges or not start_times:
+            return 0, 0
+        makespan = max(start_times[e_id] + edges_info[e_id][2] for (e_id, _, _, _) in edges)
     ratio = makespan / max_weighted_degree if max_weighted_degree > 0 else float('inf')
     return ratio, makespan
 
-def generate_diagnostic_graph(neighbors, start_times, edges_info):
+def generate_diagnostic_graph(neighbors, start_times, edges_info, index=None):
     """
     Δημιουργία διαγνωστικού γραφήματος με βάση τις διαθέσιμες μονάδες.
-    Χρησιμοποιούμε διάρκεια=1 για απλότητα.
+    Χρησιμοποιούμε διάρκεια=1 για απλότητα: κάθε ακμή καταλαμβάνει τη μονάδα
+    [s, s + 1) στα άκρα της, και ο γείτονας είναι διαθέσιμος αν ο συνδυασμός
+    των μονάδων των δύο κόμβων (από τις νωρίτερες) βρει ζεύγος που δεν συμπίπτει.
+    Με ακέραιους χρόνους έναρξης δύο μονάδες επικαλύπτονται μόνο αν ξεκινούν
+    στον ίδιο χρόνο, οπότε αυτό ισχύει ακριβώς όταν ο γείτονας έχει κάποια
+    μονάδα εκτός της πρώτης μονάδας του κόμβου: αρκούν ο μικρότερος και ο
+    μεγαλύτερος χρόνος έναρξης κάθε κόμβου από το ScheduleIndex, χωρίς
+    σάρωση ανά ζεύγος γειτόνων.
+    """
+    if not all(isinstance(s_time, int) for s_time in start_times.values()):
+        return _diagnostic_graph_scan(neighbors, start_times, edges_info)
+    if index is None:
+        index = ScheduleIndex(start_times, edges_info)
+
+    first_start, last_start = index.first_start, index.last_start
+    diagnostic_graph = {}
+    for node in list(neighbors.keys()):
+        diagnostic_graph[node] = []
+        first = first_start.get(node)
+        if first is None:
+            continue
+        for (neighbor, nbr_edge_id, w) in neighbors[node]:
+            if neighbor in first_start and (first_start[neighbor] != first or last_start[neighbor] != first):
+                diagnostic_graph[node].append((neighbor, w))
+
+    return diagnostic_graph
+
+def _diagnostic_graph_scan(neighbors, start_times, edges_info):
+    """
+    Ο αρχικός υπολογισμός του generate_diagnostic_graph (σάρωση με δύο δείκτες
+    ανά ζεύγος γειτόνων), για χρόνους έναρξης που δεν είναι ακέραιοι.
     """
     diagnostic_graph = {}
     busy_intervals = {}
@@ -300,23 +1360,134 @@ def calculate_average_start_times(start_times, edges_info):
     return avg_start_times
 
 def calculate_load_distribution(edges):
+    if isinstance(edges, CSRGraph):
+        return dict(zip(edges.nodes.tolist(), edges.degrees().tolist()))
     node_load = defaultdict(int)
     for (edge_id, node1, node2, weight) in edges:
         node_load[node1] += 1
         node_load[node2] += 1
     return dict(node_load)
 
+def connected_components(edges):
+    """
+    Χωρίζει τις ακμές σε συνεκτικές συνιστώσες με union-find (path halving,
+    ένωση κατά μέγεθος).
+    Επιστρέφει λίστα από λίστες ακμών: κάθε λίστα κρατά τη σειρά του edges και
+    οι συνιστώσες ακολουθούν τη σειρά της πρώτης ακμής τους.
+    """
+    parent, size = {}, {}
+
+    def find(node):
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for (_, node1, node2, _) in edges:
+        for node in (node1, node2):
+            if node not in parent:
+                parent[node], size[node] = node, 1
+        root1, root2 = find(node1), find(node2)
+        if root1 != root2:
+            if size[root1] < size[root2]:
+                root1, root2 = root2, root1
+            parent[root2] = root1
+            size[root1] += size[root2]
+
+    components = {}
+    for edge in edges:
+        components.setdefault(find(edge[1]), []).append(edge)
+    return list(components.values())
+
+def _solve_components(components, analyze):
+    """
+    LF και (αν analyze) ανάλυση καθυστερήσεων και διαγνωστικού γραφήματος για
+    μια ομάδα συνιστωσών (εκτελείται σε worker process). Οι συνιστώσες δεν
+    έχουν κοινούς κόμβους, οπότε λύνονται όλες μαζί σαν ένα γράφημα.
+    Επιστρέφει (start_times, delays, diagnostic_graph).
+    """
+    edges = list(chain.from_iterable(components))
+    neighbors, edges_info = build_neighbors(edges)
+    start_times = schedule_edges(edges, neighbors, edges_info)
+    if not analyze:
+        return start_times, {}, {}
+    index = ScheduleIndex(start_times, edges_info)
+    return (start_times, calculate_delays(edges, start_times, edges_info, index),
+            generate_diagnostic_graph(neighbors, start_times, edges_info, index))
+
+def schedule_components(edges, workers=None, analyze=True):
+    """
+    LF scheduling ανά συνεκτική συνιστώσα σε pool από workers processes
+    (προεπιλογή: όλοι οι πυρήνες). Ακμές διαφορετικών συνιστωσών δεν έχουν
+    κοινούς κόμβους, άρα δεν επηρεάζουν η μία την άλλη, και αφού κάθε
+    συνιστώσα κρατά τη σειρά του edges το αποτέλεσμα είναι ίδιο με το
+    schedule_edges σε όλο το γράφημα. Οι συνιστώσες μοιράζονται σε
+    4 * workers ομάδες με ισορροπημένο πλήθος ακμών, ώστε οι πολλές μικρές
+    συνιστώσες να μην κοστίζουν μία μεταφορά η καθεμία.
+    edges: ταξινομημένες ακμές (π.χ. από το sort_edges_longest_first).
+    Επιστρέφει:
+     - start_times: {edge_id: start}, με τη σειρά του edges
+     - makespan
+     - delays: {edge_id: delay} όπως το calculate_delays (None αν analyze=False)
+     - diagnostic_graph: όπως το generate_diagnostic_graph (None αν analyze=False)
+    """
+    components = connected_components(edges)
+    workers = min(workers or os.cpu_count() or 1, len(components)) or 1
+
+    if workers == 1:
+        results = [_solve_components(components, analyze)]
+    else:
+        # Μεγαλύτερη συνιστώσα πρώτα, στην ομάδα με τις λιγότερες ακμές
+        batches = [(0, i, []) for i in range(min(4 * workers, len(components)))]
+        for component in sorted(components, key=len, reverse=True):
+            count, i, batch = heapq.heappop(batches)
+            batch.append(component)
+            heapq.heappush(batches, (count + len(component), i, batch))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_solve_components, [batch for (_, _, batch) in batches],
+                                    [analyze] * len(batches)))
+
+    merged_times, merged_delays, merged_diagnostic = {}, {}, {}
+    for component_times, component_delays, component_diagnostic in results:
+        merged_times.update(component_times)
+        merged_delays.update(component_delays)
+        merged_diagnostic.update(component_diagnostic)
+
+    start_times = {}
+    makespan = 0
+    for (e_id, _, _, weight) in edges:
+        start_times[e_id] = merged_times[e_id]
+        makespan = max(makespan, start_times[e_id] + weight)
+    if not analyze:
+        return start_times, makespan, None, None
+
+    delays = {e_id: merged_delays[e_id] for e_id in start_times}
+    # Οι κόμβοι με τη σειρά που εμφανίζονται στο edges, όπως στο build_neighbors
+    node_order = dict.fromkeys(node for (_, node1, node2, _) in edges for node in (node1, node2))
+    diagnostic_graph = {node: merged_diagnostic[node] for node in node_order}
+    return start_times, makespan, delays, diagnostic_graph
+
 if __name__ == "__main__":
     execution_start_time = time.time()
 
-    filename = "inputs.txt"
-    edges = read_edges_from_file(filename)
+    parser = argparse.ArgumentParser(description="LF scheduling και διαγνωστική ανάλυση ενός γραφήματος ακμών.")
+    parser.add_argument("filename", nargs="?", default="inputs.txt")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="ανάγνωση του αρχείου χωρίς το cache filename.npz")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="LF και ανάλυση ανά συνεκτική συνιστώσα σε τόσα processes (βλ. schedule_components)")
+    args = parser.parse_args()
+
+    edges = read_edges_from_file(args.filename, use_cache=not args.no_cache)
     print(f"Loaded edges: {edges}")
 
     if not edges:
         print("Δεν βρέθηκαν ακμές στο αρχείο. Τερματισμός.")
     else:
-        binomial = is_binomial_graph(edges)
+        # Στατιστικά του γραφήματος (βαθμοί, φορτία, βάρη) με μία σάρωση των πινάκων του
+        graph = CSRGraph.from_edges(edges)
+        stats = GraphStats.from_graph(graph)
+        binomial = stats.binomial
         if binomial:
             print(f"Το γράφημα είναι δυωνυμικό.")
         else:
@@ -326,26 +1497,38 @@ if __name__ == "__main__":
         edges = sort_edges_longest_first(edges)
         print(f"Sorted edges: {edges}")
 
-        # Δημιουργία neighbors και edges_info
+        # Δημιουργία neighbors και edges_info (για τη διαγνωστική ανάλυση)
         neighbors, edges_info = build_neighbors(edges)
+        lf_order = graph.lf_order()
 
         # Προγραμματισμός με LF (Longest First)
-        start_times_lf = schedule_edges(edges, neighbors, edges_info)
-        makespan_lf = max(start_times_lf[e_id] + edges_info[e_id][2] for e_id in start_times_lf) if start_times_lf else 0
+        if args.workers:
+            # Ανά συνεκτική συνιστώσα, παράλληλα, μαζί με καθυστερήσεις και διαγνωστικό γράφο
+            start_times_lf, makespan_lf, component_delays, diagnostic_graph = schedule_components(edges, args.workers)
+            start_lf = np.array([start_times_lf[e_id] for e_id in graph.edge_ids.tolist()], dtype=np.int64)
+        else:
+            start_lf = schedule_edges_csr(graph, lf_order)
+            start_times_lf = graph.start_times_dict(start_lf, lf_order)
+            makespan_lf = int((start_lf + graph.weight).max())
         print(f"LF Start times: {start_times_lf}")
         print(f"LF Makespan: {makespan_lf}")
 
-        # Υπολογισμός ελάχιστου makespan με brute force (για επαλήθευση)
-        if len(edges) <= 6:  # Εφαρμόζουμε brute force μόνο σε μικρά γραφήματα
-            min_makespan = brute_force_makespan(edges, neighbors)
-            print(f"Brute Force Makespan: {min_makespan}")
+        # Υπολογισμός ελάχιστου makespan με branch and bound (για επαλήθευση)
+        if len(edges) <= 25:  # Εφαρμόζουμε την ακριβή λύση μόνο σε μικρά γραφήματα
+            min_makespan, _, optimal = branch_and_bound_makespan(edges, time_limit=30)
+            print(f"Exact Makespan: {min_makespan} ({'βέλτιστο' if optimal else 'όριο χρόνου, καλύτερο που βρέθηκε'})")
             if makespan_lf == min_makespan:
-                print("Ο αλγόριθμος LF υπολόγισε το ελάχιστο Makespan.")
+                print("Ο αλγόριθμος LF υπολόγισε το ελάχιστο Makespan." if optimal else
+                      "Δεν βρέθηκε καλύτερο Makespan από του LF μέσα στο όριο χρόνου.")
             else:
                 print("ΠΡΟΕΙΔΟΠΟΙΗΣΗ: Ο αλγόριθμος LF ΔΕΝ υπολόγισε το ελάχιστο Makespan!")
 
+        # Ευρετήριο του προγράμματος για τη διαγνωστική ανάλυση και τις καθυστερήσεις
+        schedule_index = None if args.workers else ScheduleIndex(start_times_lf, edges_info)
+
         # Δημιουργία διαγνωστικού γράφου
-        diagnostic_graph = generate_diagnostic_graph(neighbors, start_times_lf, edges_info)
+        if not args.workers:
+            diagnostic_graph = generate_diagnostic_graph(neighbors, start_times_lf, edges_info, schedule_index)
         print(f"Diagnostic graph: {diagnostic_graph}")
 
         # Φιλτράρισμα ακμών για nonbusy units
@@ -353,32 +1536,35 @@ if __name__ == "__main__":
         print(f"Filtered edges: {filtered_edges}")
 
         # Μέσοι χρόνοι έναρξης
-        avg_start_times = calculate_average_start_times(start_times_lf, edges_info)
+        # Οι κόμβοι με τη σειρά που εμφανίζονται στις ταξινομημένες ακμές (όπως στο neighbors)
+        avg_start_times = stats.as_dict(stats.average_start(start_lf), neighbors)
         print("Average Start Times (per node):")
         for node, avg_time in avg_start_times.items():
             print(f"Node {node}: {avg_time:.2f}")
 
         # Κατανομή φορτίου
-        load_distribution = calculate_load_distribution(edges)
+        load_distribution = stats.as_dict(stats.degree, neighbors)
         print("Load Distribution (per node):")
         for node, load in load_distribution.items():
             print(f"Node {node}: {load} edges")
 
-        # Υπολογισμός max_weighted_degree από neighbors
-        max_weighted_degree = 0
-        for node in neighbors:
-            w_sum = sum(w for (nbr, e_id, w) in neighbors[node])
-            if w_sum > max_weighted_degree:
-                max_weighted_degree = w_sum
+        # Υπολογισμός max_weighted_degree
+        max_weighted_degree = stats.max_weighted_degree
         print(f"Max weighted degree: {max_weighted_degree}")
+        print(f"Weight histogram: {stats.weight_histogram()}")
+        print(f"Makespan lower bound: {stats.lower_bound}")
 
         # Έλεγχος demand schedule και καθυστερήσεων
-        is_demand_schedule, delays = calculate_demand_schedule_and_delay(edges, start_times_lf, edges_info, binomial)
+        if args.workers and not binomial:
+            delays = component_delays
+            is_demand_schedule = all(d == 0 for d in delays.values())
+        else:
+            is_demand_schedule, delays = calculate_demand_schedule_and_delay(edges, start_times_lf, edges_info, binomial, schedule_index)
         print(f"Is demand schedule: {is_demand_schedule}")
         print(f"Delays: {delays}")
 
         # Υπολογισμός λόγου LF(G)/OPT(G)
-        ratio, computed_makespan = evaluate_ratio(edges, start_times_lf, edges_info, max_weighted_degree)
+        ratio, computed_makespan = evaluate_ratio(graph, start_lf, edges_info, max_weighted_degree)
         print(f"Ratio (makespan/Δ): {ratio}, Computed Makespan: {computed_makespan}")
 
         if binomial:
@@ -0,0 +1,110 @@
+import numpy as np
+
+
+class GraphStats:
+    """
+    Στατιστικά του γραφήματος του krwsky, υπολογισμένα με bincount πάνω στους
+    πίνακες άκρων/βαρών αντί για βρόχους πάνω στο neighbors:
+      - nodes[i]: η ετικέτα του κόμβου i (ταξινομημένες, όπως στο CSRGraph)
+      - degree[i]: πλήθος ακμών του κόμβου (όπως το calculate_load_distribution)
+      - weighted_degree[i]: άθροισμα βαρών του κόμβου
+      - busy_time[i]: ο χρόνος αυτός με κάθε βρόχο μία φορά
+      - weight_values, weight_counts: ιστόγραμμα βαρών
+    Στα degree/weighted_degree οι βρόχοι (node1 == node2) μετρούν δύο φορές,
+    όπως στο build_neighbors.
+    """
+    __slots__ = ("nodes", "src", "dst", "degree", "weighted_degree", "busy_time", "weight_values", "weight_counts",
+                 "total_weight")
+
+    def __init__(self, node1, node2, weight, nodes=None):
+        """
+        node1, node2: ετικέτες των άκρων κάθε ακμής ή, αν δίνεται το nodes,
+        δείκτες 0..len(nodes)-1 (π.χ. τα src/dst ενός CSRGraph, χωρίς αντιγραφή).
+        """
+        weight = np.asarray(weight, dtype=np.int64)
+        if nodes is None:
+            ends = np.stack((np.asarray(node1, dtype=np.int64), np.asarray(node2, dtype=np.int64)), axis=1).ravel()
+            nodes, ends = np.unique(ends, return_inverse=True)
+            node1, node2 = ends[0::2], ends[1::2]
+        self.nodes, self.src, self.dst = nodes, node1, node2
+        n = len(nodes)
+
+        self.degree = np.bincount(node1, minlength=n) + np.bincount(node2, minlength=n)
+        self.weighted_degree = (np.bincount(node1, weights=weight, minlength=n)
+                                + np.bincount(node2, weights=weight, minlength=n)).astype(np.int64)
+        loops = node1 == node2
+        self.busy_time = self.weighted_degree - np.bincount(node1[loops], weights=weight[loops],
+                                                            minlength=n).astype(np.int64)
+        self.weight_values, self.weight_counts = np.unique(weight, return_counts=True)
+        self.total_weight = int(weight.sum())
+
+    @classmethod
+    def from_graph(cls, graph):
+        """ Στατιστικά ενός CSRGraph, πάνω στους πίνακές του. """
+        return cls(graph.src, graph.dst, graph.weight, graph.nodes)
+
+    @classmethod
+    def from_edges(cls, edges):
+        """ Στατιστικά από λίστα ακμών (edge_id, node1, node2, weight). """
+        if not edges:
+            return cls([], [], [])
+        _, node1, node2, weight = zip(*edges)
+        return cls(node1, node2, weight)
+
+    @property
+    def num_edges(self):
+        return len(self.src)
+
+    @property
+    def binomial(self):
+        """ Ακριβώς δύο διαφορετικά βάρη (όπως το is_binomial_graph). """
+        return len(self.weight_values) == 2
+
+    @property
+    def max_weighted_degree(self):
+        """ Δ, όπως τον υπολογίζει το krwsky (βρόχοι δύο φορές). """
+        return int(self.weighted_degree.max()) if len(self.weighted_degree) else 0
+
+    @property
+    def busy_bound(self):
+        """ Κάθε κόμβος εκτελεί τις ακμές του μία-μία: makespan ≥ max busy_time. """
+        return int(self.busy_time.max()) if len(self.busy_time) else 0
+
+    @property
+    def matching_bound(self):
+        """
+        Κάθε στιγμή τρέχουν το πολύ floor(n/2) ακμές χωρίς κοινό άκρο, οπότε
+        makespan ≥ ceil(συνολικό βάρος / floor(n/2)). Οι βρόχοι δεν λαμβάνονται υπόψη.
+        """
+        if np.any(self.src == self.dst):
+            return 0
+        pairs = len(self.nodes) // 2
+        return -(-self.total_weight // pairs) if pairs else 0
+
+    @property
+    def lower_bound(self):
+        return max(self.busy_bound, self.matching_bound)
+
+    def average_start(self, start):
+        """
+        Μέσος χρόνος έναρξης των ακμών κάθε κόμβου (όπως το calculate_average_start_times).
+        start: χρόνος έναρξης ανά ακμή, με τη σειρά των node1/node2.
+        Για κόμβους χωρίς ακμές επιστρέφεται nan.
+        """
+        n = len(self.nodes)
+        start = np.asarray(start, dtype=np.float64)
+        total = np.bincount(self.src, weights=start, minlength=n) + np.bincount(self.dst, weights=start, minlength=n)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return total / self.degree
+
+    def as_dict(self, values, order=None):
+        """
+        {ετικέτα κόμβου: τιμή} για έναν πίνακα ανά κόμβο, με τη σειρά των
+        ετικετών (ταξινομημένες) ή, αν δίνεται, με τη σειρά του order (ετικέτες).
+        """
+        result = dict(zip(self.nodes.tolist(), np.asarray(values).tolist()))
+        return result if order is None else {node: result[node] for node in order}
+
+    def weight_histogram(self):
+        """ {βάρος: πλήθος ακμών}. """
+        return dict(zip(self.weight_values.tolist(), self.weight_counts.tolist()))
@@ -0,0 +1,117 @@
+import argparse
+import csv
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from PLB import JobTable, plb_scheduling_fast
+from plb_io import iter_text_instances, load_binary_instances
+
+RESULT_FIELDS = ["file", "instance", "T", "N", "calibrations", "feasible", "sec"]
+
+
+def iter_instance_files(sim_dir):
+    """
+    Επιστρέφει με σταθερή (ταξινομημένη) σειρά όλα τα αρχεία .txt και .plbin
+    κάτω από τον φάκελο sim_dir, π.χ. simulationsLog2/simD_ratio1.5/simT16N60000.txt.
+    Αν υπάρχει και δυαδική έκδοση (.plbin, βλ. plb_io.py) ενός αρχείου .txt,
+    επιστρέφεται μόνο η δυαδική.
+    """
+    for root, dirs, files in os.walk(sim_dir):
+        dirs.sort()
+        names = set(files)
+        for name in sorted(files):
+            stem, ext = os.path.splitext(name)
+            if ext == ".plbin" or (ext == ".txt" and stem + ".plbin" not in names):
+                yield os.path.join(root, name)
+
+
+def iter_tasks(sim_dir):
+    """
+    Διαβάζει σταδιακά κάθε instance από κάθε αρχείο του sim_dir.
+    Επιστρέφει (generator) tuples (file, instance, T, columns), όπου columns
+    είναι (ids, deadlines, times) για αρχεία κειμένου και None για δυαδικά
+    αρχεία: τότε ο worker κάνει ο ίδιος mmap το αρχείο, ώστε οι στήλες να μη
+    μεταφέρονται (pickle) μεταξύ processes.
+    """
+    for path in iter_instance_files(sim_dir):
+        if path.endswith(".plbin"):
+            for index, (T, ids, deadlines, times) in enumerate(load_binary_instances(path)):
+                yield path, index, T, None
+        else:
+            for index, (T, ids, deadlines, times) in enumerate(iter_text_instances(path)):
+                yield path, index, T, (ids, deadlines, times)
+
+
+# Δυαδικά αρχεία που έχει ήδη κάνει mmap ο worker: {path: instances}
+_mapped = {}
+
+
+def _binary_columns(path, index):
+    if path not in _mapped:
+        _mapped.clear()
+        _mapped[path] = load_binary_instances(path)
+    return _mapped[path][index][1:]
+
+
+def solve_instance(task):
+    """
+    Λύνει ένα instance με το plb_scheduling_fast (εκτελείται σε worker process).
+    Επιστρέφει μια γραμμή αποτελεσμάτων (dict με πεδία RESULT_FIELDS).
+    """
+    path, index, T, columns = task
+    ids, deadlines, times = columns if columns is not None else _binary_columns(path, index)
+    start = time.perf_counter()
+    calibrations, exec_intervals = plb_scheduling_fast(JobTable(ids, deadlines, times), T)
+    sec = time.perf_counter() - start
+    return {
+        "file": path,
+        "instance": index,
+        "T": T,
+        "N": len(ids),
+        "calibrations": len(calibrations),
+        "feasible": int(bool(calibrations) or not len(ids)),
+        "sec": f"{sec:.6f}",
+    }
+
+
+def run_batch(sim_dir, output_file, workers=None):
+    """
+    Λύνει όλα τα instances του sim_dir σε pool από workers processes
+    (προεπιλογή: όλοι οι πυρήνες) και γράφει μία γραμμή CSV ανά instance.
+    Τα instances διαβάζονται σταδιακά και το πολύ 2 * workers instances
+    περιμένουν να λυθούν κάθε στιγμή. Η σειρά των γραμμών ακολουθεί τη σειρά
+    των αρχείων, ανεξάρτητα από το ποιος worker τελειώνει πρώτος.
+    Επιστρέφει το πλήθος των instances που λύθηκαν.
+    """
+    workers = workers or os.cpu_count() or 1
+    count = 0
+    with open(output_file, 'w', newline='', encoding='utf-8') as out, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        writer = csv.DictWriter(out, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+
+        pending = deque()
+        for task in iter_tasks(sim_dir):
+            pending.append(pool.submit(solve_instance, task))
+            if len(pending) >= 2 * workers:
+                writer.writerow(pending.popleft().result())
+                count += 1
+        while pending:
+            writer.writerow(pending.popleft().result())
+            count += 1
+
+    return count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batch εκτέλεση του PLB σε φάκελο simulations.")
+    parser.add_argument("sim_dir", nargs="?", default=os.path.join("simulationsLog2", "simD_ratio1.5"))
+    parser.add_argument("-o", "--output", default="resultsPLB.csv")
+    parser.add_argument("-w", "--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    start_time = time.time()
+    solved = run_batch(args.sim_dir, args.output, args.workers)
+    print(f"[INFO] Solved {solved} instances in {time.time() - start_time:.2f} sec -> {args.output}")
@@ -0,0 +1,200 @@
+import argparse
+import csv
+import gc
+import json
+import math
+import random
+import statistics
+import time
+import tracemalloc
+
+from PLB import Job, JobTable, edf_schedule, plb_scheduling, plb_scheduling_fast
+
+RESULT_FIELDS = [
+    "target", "N", "T_mode", "T", "d_ratio", "seed", "repeats", "calibrations",
+    "median", "p10", "p90", "min", "max", "peak_mem_bytes",
+]
+
+# Χρονοδιαγράμματα για το T ως συνάρτηση του N
+T_MODES = {
+    "fixed": lambda N, fixed: fixed,
+    "log2": lambda N, fixed: math.ceil(math.log(N, 2)),
+    "sqrt": lambda N, fixed: math.ceil(math.sqrt(N)),
+}
+
+
+def generate_jobs(N, d_ratio, seed, p_min=1, p_max=100):
+    """
+    Ίδια κατανομή με το job-generator-PLB.py, αλλά με δικό της seeded
+    random.Random ώστε κάθε (N, d_ratio, seed) να δίνει πάντα το ίδιο instance.
+    Επιστρέφει (ids, deadlines, times).
+    """
+    rng = random.Random(f"{seed}:{N}:{d_ratio}")
+    d_min = 2 * p_max
+    d_max = round(N * (p_min + p_max) / 2 * d_ratio)
+    ids = list(range(1, N + 1))
+    deadlines = [rng.randint(d_min, d_max) for _ in ids]
+    times = [rng.randint(p_min, p_max) for _ in ids]
+    return ids, deadlines, times
+
+
+def _run_plb(instance, T):
+    """ Το αρχικό plb_scheduling (O(n²)) πάνω σε λίστα Job. """
+    jobs = [Job(i, d, p) for i, d, p in zip(*instance)]
+    return lambda: len(plb_scheduling(jobs, T)[0])
+
+
+def _run_plb_fast(instance, T):
+    table = JobTable(*instance)
+    return lambda: len(plb_scheduling_fast(table, T)[0])
+
+
+def _run_edf(instance, T):
+    """ Ένα EDF (edf_schedule) σε όλο το [0, max d) πάνω σε λίστα Job. """
+    jobs = [Job(i, d, p) for i, d, p in zip(*instance)]
+    horizon = max(instance[1], default=0)
+
+    def run():
+        edf_schedule(jobs, 0, horizon)
+    return run
+
+
+def _run_edf_table(instance, T):
+    table = JobTable(*instance)
+    horizon = max(instance[1], default=0)
+
+    def run():
+        edf_schedule(table, 0, horizon)
+    return run
+
+
+# Κάθε target δέχεται (instance, T) και επιστρέφει μια συνάρτηση χωρίς ορίσματα
+# που εκτελεί τον αλγόριθμο και επιστρέφει το πλήθος των calibrations (None για το EDF).
+# Η προετοιμασία (Job, JobTable) δεν χρονομετρείται.
+TARGETS = {
+    "plb": _run_plb,
+    "plb_fast": _run_plb_fast,
+    "edf": _run_edf,
+    "edf_table": _run_edf_table,
+}
+
+
+def _percentile(sorted_values, q):
+    """ Γραμμική παρεμβολή, όπως το numpy.percentile. """
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    pos = (len(sorted_values) - 1) * q / 100.0
+    low = math.floor(pos)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (pos - low)
+
+
+def measure(target, instance, T, repeats=5, warmup=1, memory=True):
+    """
+    Χρονομετρεί ένα target σε ένα instance: warmup εκτελέσεις που δεν
+    μετρούν, repeats χρονομετρημένες εκτελέσεις και (αν memory=True) μία
+    επιπλέον εκτέλεση με tracemalloc για τη μέγιστη μνήμη, ώστε το tracemalloc
+    να μην επηρεάζει τους χρόνους.
+    Επιστρέφει dict με calibrations, median, p10, p90, min, max, peak_mem_bytes.
+    """
+    prepare = TARGETS[target]
+    for _ in range(warmup):
+        prepare(instance, T)()
+
+    times = []
+    calibrations = None
+    for _ in range(repeats):
+        run = prepare(instance, T)
+        gc.collect()
+        start = time.perf_counter()
+        calibrations = run()
+        times.append(time.perf_counter() - start)
+    times.sort()
+
+    peak = None
+    if memory:
+        run = prepare(instance, T)
+        gc.collect()
+        tracemalloc.start()
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        "calibrations": calibrations,
+        "median": statistics.median(times),
+        "p10": _percentile(times, 10),
+        "p90": _percentile(times, 90),
+        "min": times[0],
+        "max": times[-1],
+        "peak_mem_bytes": peak,
+    }
+
+
+def run_suite(targets, N_list, T_modes, d_ratios, seed=0, fixed_T=10, repeats=5, warmup=1,
+              memory=True, max_n=None):
+    """
+    Εκτελεί όλους τους συνδυασμούς target × N × T_mode × d_ratio.
+    max_n: προαιρετικό λεξικό {target: μέγιστο N}, π.χ. για να μην τρέχει το
+    O(n²) plb σε 1M εργασίες.
+    Επιστρέφει (generator) μία γραμμή αποτελεσμάτων ανά συνδυασμό.
+    """
+    max_n = max_n or {}
+    for N in N_list:
+        for d_ratio in d_ratios:
+            instance = generate_jobs(N, d_ratio, seed)
+            for T_mode in T_modes:
+                T = T_MODES[T_mode](N, fixed_T)
+                for target in targets:
+                    if N > max_n.get(target, N):
+                        continue
+                    row = {"target": target, "N": N, "T_mode": T_mode, "T": T,
+                           "d_ratio": d_ratio, "seed": seed, "repeats": repeats}
+                    row.update(measure(target, instance, T, repeats, warmup, memory))
+                    yield row
+
+
+def write_results(rows, json_path=None, csv_path=None):
+    """ Γράφει τα αποτελέσματα σε JSON ή/και CSV. """
+    rows = list(rows)
+    if json_path:
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, indent=2)
+    if csv_path:
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark suite για το PLB και το EDF.")
+    parser.add_argument("--targets", nargs="+", default=["plb", "plb_fast", "edf", "edf_table"],
+                        choices=sorted(TARGETS))
+    parser.add_argument("--N", nargs="+", type=int, default=[1000, 10000, 100000, 1000000])
+    parser.add_argument("--T-modes", nargs="+", default=["fixed", "log2", "sqrt"], choices=sorted(T_MODES))
+    parser.add_argument("--fixed-T", type=int, default=10)
+    parser.add_argument("--d-ratios", nargs="+", type=float, default=[1.5, 3.0])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument("--plb-max-n", type=int, default=20000,
+                        help="μέγιστο N για το O(n²) plb_scheduling")
+    parser.add_argument("--json", default="benchmarkPLB.json")
+    parser.add_argument("--csv", default="benchmarkPLB.csv")
+    args = parser.parse_args()
+
+    def report(rows):
+        for row in rows:
+            print(f"{row['target']:>9} N={row['N']:<8} T={row['T']:<5} ({row['T_mode']}) "
+                  f"ratio={row['d_ratio']} median={row['median']:.4f}s p90={row['p90']:.4f}s "
+                  f"calibr={row['calibrations']}")
+            yield row
+
+    write_results(
+        report(run_suite(args.targets, args.N, args.T_modes, args.d_ratios, args.seed, args.fixed_T,
+                         args.repeats, args.warmup, not args.no_memory, {"plb": args.plb_max_n})),
+        args.json, args.csv,
+    )
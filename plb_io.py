@@ -0,0 +1,239 @@
+import mmap
+import os
+import struct
+import sys
+import warnings
+from array import array
+
+import numpy as np
+
+# Δυαδική μορφή instances PLB (little-endian int64):
+#   MAGIC (8 bytes), K = πλήθος instances
+#   για κάθε instance: T, N, ids[N], d[N], p[N]
+# Οι στήλες είναι συνεχόμενες, οπότε μετά από mmap διαβάζονται χωρίς αντιγραφή.
+MAGIC = b"PLBBIN01"
+_INT = struct.Struct("<q")
+_HEADER = struct.Struct("<8sq")
+# Μέγεθος κομματιού ανάγνωσης των αρχείων κειμένου
+TEXT_CHUNK_BYTES = 1 << 22
+
+
+def _column(values):
+    """ Στήλη array('q') από (πιθανώς strided) πίνακα np.int64. """
+    column = array('q')
+    column.frombytes(np.ascontiguousarray(values, dtype=np.int64).tobytes())
+    return column
+
+
+def _bad_line(data, first_line):
+    """ Ο αριθμός της πρώτης γραμμής του data με πεδίο που δεν είναι ακέραιος. """
+    for line_no, line in enumerate(data.split(b"\n"), first_line):
+        try:
+            [int(part) for part in line.split()]
+        except ValueError:
+            return line_no
+    return first_line
+
+
+def _line_fields(data):
+    """
+    Πλήθος πεδίων (λέξεων) ανά γραμμή του data, με πράξεις NumPy πάνω στα bytes,
+    και οι γραμμές (δείκτες από 0) με πεδία που είναι μόνο πρόσημο ("-", "+"),
+    τα οποία το np.fromstring διαβάζει σιωπηλά ως 0.
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    blank = buf <= 32  # κενά, tabs, αλλαγές γραμμής (άλλοι χαρακτήρες ελέγχου απορρίπτονται στο parse)
+    # Αρχή πεδίου: byte που δεν είναι κενό, μετά από κενό (ή στην αρχή)
+    token_start = np.flatnonzero(blank[:-1] > blank[1:]) + 1
+    if len(buf) and not blank[0]:
+        token_start = np.concatenate(([0], token_start))
+    newline = np.flatnonzero(buf == 10)
+    bounds = np.concatenate(([0], newline + 1, [len(buf)]))
+    counts = np.diff(np.searchsorted(token_start, bounds))
+
+    lone_sign = np.zeros(0, dtype=np.int64)
+    if b"-" in data or b"+" in data:
+        sign = np.flatnonzero((buf == 43) | (buf == 45))
+        before = np.where(sign > 0, blank[np.maximum(sign - 1, 0)], True)
+        after = np.where(sign + 1 < len(buf), blank[np.minimum(sign + 1, len(buf) - 1)], True)
+        lone_sign = sign[before & after]
+    return counts, np.searchsorted(newline, lone_sign)
+
+
+def iter_text_instances(input_file_path, chunk_bytes=TEXT_CHUNK_BYTES):
+    """
+    Διαβάζει σταδιακά τα instances ενός αρχείου κειμένου της μορφής του
+    job-generator-PLB.py (T, N και N γραμμές "id r d p" ανά instance, κενές
+    γραμμές ανάμεσα αγνοούνται): το αρχείο διαβάζεται σε κομμάτια των
+    chunk_bytes, κάθε κομμάτι (κομμένο σε τέλος γραμμής) μετατρέπεται με μία
+    κλήση του np.fromstring σε πίνακα ακεραίων, και οι στήλες κάθε instance
+    προκύπτουν με slicing βήματος 4. Το πλήθος πεδίων κάθε γραμμής μετριέται
+    πρώτα με NumPy (1 για τις γραμμές T και N, 4 για κάθε εργασία), ώστε μια
+    λάθος γραμμή να μη μετατοπίζει τις επόμενες τιμές.
+    Επιστρέφει (generator) (T, ids, deadlines, times) με στήλες array('q').
+    Κρατά στη μνήμη μόνο ένα κομμάτι και το τρέχον instance.
+    Σε λάθος μορφή προκαλεί ValueError με τον αριθμό της γραμμής.
+    """
+    pending = np.zeros(0, dtype=np.int64)
+    # Πλήθος πεδίων και αριθμός γραμμής για κάθε μη κενή γραμμή των τιμών του pending
+    fields = np.zeros(0, dtype=np.int64)
+    lines = np.zeros(0, dtype=np.int64)
+    index, line_no = 0, 1
+
+    def wrong_fields(i, expected):
+        return ValueError(f"{input_file_path}: line {int(lines[i])} should have {expected} field(s), "
+                          f"found {int(fields[i])}")
+
+    with open(input_file_path, 'rb') as f:
+        rest = b""
+        while True:
+            block = f.read(chunk_bytes)
+            data = rest + block
+            cut = data.rfind(b"\n") + 1 if block else len(data)
+            data, rest = data[:cut], data[cut:]
+            if data.strip():
+                counts, lone_sign = _line_fields(data)
+                if lone_sign.size:
+                    raise ValueError(f"{input_file_path}: non-integer field at line {line_no + int(lone_sign[0])}")
+                # Το np.fromstring σταματά (με warning) στο πρώτο πεδίο που δεν είναι ακέραιος
+                with warnings.catch_warnings():
+                    warnings.simplefilter("error", DeprecationWarning)
+                    try:
+                        values = np.fromstring(data, dtype=np.int64, sep=" ")
+                    except (ValueError, DeprecationWarning):
+                        values = None
+                if values is None or len(values) != counts.sum():
+                    raise ValueError(f"{input_file_path}: non-integer field at line {_bad_line(data, line_no)}")
+                nonblank = np.flatnonzero(counts)
+                pending = np.concatenate((pending, values)) if len(pending) else values
+                fields = np.concatenate((fields, counts[nonblank]))
+                lines = np.concatenate((lines, nonblank + line_no))
+
+            pos, row = 0, 0
+            while len(fields) - row >= 2:
+                if fields[row] != 1:
+                    raise wrong_fields(row, 1)
+                if fields[row + 1] != 1:
+                    raise wrong_fields(row + 1, 1)
+                T, N = int(pending[pos]), int(pending[pos + 1])
+                if N < 0:
+                    raise ValueError(f"{input_file_path}: negative number of jobs at line {int(lines[row + 1])}")
+                bad = np.flatnonzero(fields[row + 2:row + 2 + N] != 4)
+                if bad.size:
+                    raise wrong_fields(row + 2 + bad[0], 4)
+                if row + 2 + N > len(fields):
+                    break
+                start, end = pos + 2, pos + 2 + 4 * N
+                yield (T, _column(pending[start:end:4]), _column(pending[start + 2:end:4]),
+                       _column(pending[start + 3:end:4]))
+                index += 1
+                pos, row = end, row + 2 + N
+            pending, fields, lines = pending[pos:], fields[row:], lines[row:]
+            line_no += data.count(b"\n")
+            if not block:
+                break
+
+    if len(fields):
+        if fields[0] != 1:
+            raise wrong_fields(0, 1)
+        N = int(pending[1]) if len(pending) > 1 else 0
+        raise ValueError(f"{input_file_path}: instance {index} has fewer than {N} jobs")
+
+
+def load_text_instances(input_file_path):
+    """ Όλα τα instances ενός αρχείου κειμένου (βλ. iter_text_instances) σε λίστα. """
+    return list(iter_text_instances(input_file_path))
+
+
+def write_binary_instances(output_file_path, instances):
+    """
+    Γράφει instances (T, ids, deadlines, times) στη δυαδική μορφή. Τα
+    instances μπορεί να είναι generator: το πλήθος τους γράφεται στο header
+    στο τέλος.
+    """
+    count = 0
+    with open(output_file_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, 0))
+        for T, ids, deadlines, times in instances:
+            count += 1
+            f.write(_INT.pack(T))
+            f.write(_INT.pack(len(ids)))
+            for column in (ids, deadlines, times):
+                column = column if isinstance(column, array) and column.typecode == 'q' else array('q', column)
+                if sys.byteorder != "little":
+                    column = array('q', column)
+                    column.byteswap()
+                f.write(column.tobytes())
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, count))
+
+
+def convert_text_to_binary(input_file_path, output_file_path=None):
+    """
+    Μετατρέπει ένα αρχείο κειμένου σε δυαδικό (προεπιλογή: ίδιο όνομα με κατάληξη .plbin).
+    Επιστρέφει τη διαδρομή του δυαδικού αρχείου.
+    """
+    if output_file_path is None:
+        output_file_path = os.path.splitext(input_file_path)[0] + ".plbin"
+    write_binary_instances(output_file_path, iter_text_instances(input_file_path))
+    return output_file_path
+
+
+def load_binary_instances(input_file_path):
+    """
+    Φορτώνει ένα δυαδικό αρχείο με mmap. Οι στήλες επιστρέφονται ως
+    memoryview('q') πάνω στο mmap, χωρίς αντιγραφή: η φόρτωση κοστίζει
+    μόνο την ανάγνωση των headers και τα processes που ανοίγουν το ίδιο
+    αρχείο μοιράζονται τις σελίδες του μέσω του page cache. Σε big-endian
+    μηχανές οι τιμές αντιγράφονται μία φορά στη σειρά bytes της μηχανής.
+    Επιστρέφει λίστα από (T, ids, deadlines, times).
+    """
+    with open(input_file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+    if size < _HEADER.size:
+        raise ValueError(f"{input_file_path}: not a PLB binary instance file")
+    magic, K = _HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{input_file_path}: not a PLB binary instance file")
+
+    words = np.frombuffer(buffer, dtype='<i8', count=size // _INT.size)
+    if not words.dtype.isnative:
+        words = words.astype('=i8')
+    words = memoryview(words).cast('B').cast('q')
+    instances = []
+    pos = _HEADER.size // _INT.size
+    for _ in range(K):
+        T, N = words[pos], words[pos + 1]
+        start = pos + 2
+        if start + 3 * N > len(words):
+            raise ValueError(f"{input_file_path}: truncated instance {len(instances)}")
+        instances.append((T, words[start:start + N], words[start + N:start + 2 * N],
+                          words[start + 2 * N:start + 3 * N]))
+        pos = start + 3 * N
+    return instances
+
+
+def iter_instances(input_file_path):
+    """
+    Instances από δυαδικό (.plbin, με mmap) ή αρχείο κειμένου (σταδιακά, βλ.
+    iter_text_instances), ανάλογα με την κατάληξη.
+    Επιστρέφει (generator) (T, ids, deadlines, times).
+    """
+    if input_file_path.endswith(".plbin"):
+        return iter(load_binary_instances(input_file_path))
+    return iter_text_instances(input_file_path)
+
+
+def load_instances(input_file_path):
+    """ Φορτώνει instances από δυαδικό (.plbin) ή αρχείο κειμένου, ανάλογα με την κατάληξη. """
+    if input_file_path.endswith(".plbin"):
+        return load_binary_instances(input_file_path)
+    return load_text_instances(input_file_path)
+
+
+if __name__ == "__main__":
+    # Μετατροπή αρχείων κειμένου σε δυαδική μορφή: python plb_io.py simT16N60000.txt ...
+    for path in sys.argv[1:]:
+        print(f"[INFO] {path} -> {convert_text_to_binary(path)}")
@@ -0,0 +1,187 @@
+import numpy as np
+
+from PLB import IntervalColumns, JobTable, plb_scheduling_stream
+
+
+def _as_int_array(values):
+    """ Μετατροπή σε np.int64 χωρίς αντιγραφή για array('q') και numpy πίνακες. """
+    if isinstance(values, np.ndarray):
+        return values.astype(np.int64, copy=False)
+    try:
+        return np.frombuffer(values, dtype=np.int64)
+    except TypeError:
+        return np.asarray(values, dtype=np.int64)
+
+
+def _job_rows(ids, job_id):
+    """
+    Για κάθε job_id βρίσκει τη γραμμή του στο ids.
+    Επιστρέφει (row, known) όπου known[i] είναι False για άγνωστα job_id.
+    Όταν τα ids είναι πυκνά (π.χ. 1..N) χρησιμοποιείται πίνακας αντιστοίχισης
+    σε O(N), αλλιώς ταξινόμηση και searchsorted.
+    """
+    if not len(ids):
+        return np.zeros(len(job_id), dtype=np.int64), np.zeros(len(job_id), dtype=bool)
+    low, high = ids.min(), ids.max()
+    if high - low < 4 * len(ids):
+        lookup = np.full(high - low + 1, -1, dtype=np.int64)
+        lookup[ids - low] = np.arange(len(ids))
+        offset = job_id - low
+        in_range = (offset >= 0) & (offset <= high - low)
+        row = np.where(in_range, lookup[np.clip(offset, 0, high - low)], -1)
+        return row, row >= 0
+    order = np.argsort(ids, kind="stable")
+    sorted_ids = ids[order]
+    pos = np.minimum(np.searchsorted(sorted_ids, job_id), len(ids) - 1)
+    return order[pos], sorted_ids[pos] == job_id
+
+
+def validate_schedule(jobs, windows, intervals, T=None, calibrations=None):
+    """
+    Ελέγχει ένα πρόγραμμα PLB με sort-and-sweep πράξεις NumPy (χωρίς βρόχους Python).
+      - jobs: (ids, d, p) με τους αρχικούς χρόνους εκτέλεσης p
+      - windows: (start, end) των calibrated διαστημάτων [t, u)
+      - intervals: (job_id, start, end) ή IntervalColumns
+      - T: (προαιρετικά) το μήκος κάθε calibration
+      - calibrations: (προαιρετικά) τα calibrations που επέστρεψε το PLB, ένα ανά
+        window (το τέλος του u), με τη σειρά των windows
+    Έλεγχοι:
+      - κάθε διάστημα έχει θετικό μήκος και αφορά γνωστή εργασία
+      - τα διαστήματα κάθε εργασίας αθροίζουν ακριβώς στο p της
+      - κάθε διάστημα τελειώνει μέχρι την προθεσμία της εργασίας
+      - τα διαστήματα δεν επικαλύπτονται (μία μηχανή)
+      - κάθε διάστημα βρίσκεται μέσα σε calibrated διάστημα
+      - με T: τα windows δεν επικαλύπτονται και αποτελούνται από calibrations μήκους T,
+        δηλαδή το μήκος τους είναι πολλαπλάσιο του T, εκτός αν τελειώνουν στη μεγαλύτερη
+        προθεσμία (τότε το τελευταίο calibration κόβεται εκεί, όπως στο PLB)
+      - με calibrations: το πλήθος τους ισούται με το πλήθος των windows και το
+        καθένα είναι το τέλος του αντίστοιχου window
+    Επιστρέφει λίστα με μηνύματα σφαλμάτων (κενή αν το πρόγραμμα είναι έγκυρο).
+    """
+    ids, deadlines, times = (_as_int_array(col) for col in jobs)
+    win_start, win_end = (_as_int_array(col) for col in windows)
+    if isinstance(intervals, IntervalColumns):
+        intervals = (intervals.job_id, intervals.start, intervals.end)
+    job_id, start, end = (_as_int_array(col) for col in intervals)
+    errors = []
+
+    bad = np.flatnonzero(end <= start)
+    if bad.size:
+        errors.append(f"{bad.size} intervals with non-positive length, e.g. job {job_id[bad[0]]} "
+                      f"[{start[bad[0]]}, {end[bad[0]]})")
+
+    # Αντιστοίχιση job_id -> γραμμή εργασίας
+    row, known = _job_rows(ids, job_id)
+    bad = np.flatnonzero(~known)
+    if bad.size:
+        errors.append(f"{bad.size} intervals of unknown jobs, e.g. job {job_id[bad[0]]}")
+    row = row[known]
+    k_start, k_end = start[known], end[known]
+
+    # Συνολικός χρόνος ανά εργασία
+    executed = np.bincount(row, weights=k_end - k_start, minlength=len(ids)).astype(np.int64)
+    bad = np.flatnonzero(executed != times)
+    if bad.size:
+        errors.append(f"{bad.size} jobs with executed time != p, e.g. job {ids[bad[0]]}: "
+                      f"{executed[bad[0]]} != {times[bad[0]]}")
+
+    # Προθεσμίες
+    bad = np.flatnonzero(k_end > deadlines[row])
+    if bad.size:
+        errors.append(f"{bad.size} intervals end after the deadline, e.g. job {ids[row[bad[0]]]} "
+                      f"ends at {k_end[bad[0]]} > {deadlines[row[bad[0]]]}")
+
+    # Επικαλύψεις: μετά την ταξινόμηση κατά start αρκεί ο έλεγχος διαδοχικών διαστημάτων.
+    # Η έξοδος του PLB είναι ήδη σε χρονική σειρά, οπότε συνήθως η ταξινόμηση παραλείπεται.
+    if np.all(start[1:] >= start[:-1]):
+        by_start = np.arange(len(start))
+        s_sorted, e_sorted = start, end
+    else:
+        by_start = np.argsort(start, kind="stable")
+        s_sorted, e_sorted = start[by_start], end[by_start]
+    bad = np.flatnonzero(s_sorted[1:] < e_sorted[:-1])
+    if bad.size:
+        i = by_start[bad[0]]
+        j = by_start[bad[0] + 1]
+        errors.append(f"{bad.size} overlapping intervals, e.g. job {job_id[i]} [{start[i]}, {end[i]}) "
+                      f"and job {job_id[j]} [{start[j]}, {end[j]})")
+
+    # Calibrated διαστήματα: ένωση των windows και έλεγχος ότι κάθε διάστημα εκτέλεσης
+    # βρίσκεται μέσα σε ένα συνεχές κομμάτι της ένωσης
+    bad = np.flatnonzero(win_end <= win_start)
+    if bad.size:
+        errors.append(f"{bad.size} calibration windows with non-positive length")
+    w_order = np.argsort(win_start, kind="stable")
+    w_start, w_end = win_start[w_order], np.maximum.accumulate(win_end[w_order])
+    if len(w_start):
+        # Νέο κομμάτι ξεκινά όπου το start ξεπερνά όλα τα προηγούμενα end
+        new_block = np.ones(len(w_start), dtype=bool)
+        new_block[1:] = w_start[1:] > w_end[:-1]
+        block_start = w_start[new_block]
+        block_end = np.append(w_end[np.flatnonzero(new_block)[1:] - 1], w_end[-1])
+        block = np.searchsorted(block_start, s_sorted, side="right") - 1
+        inside = (block >= 0) & (e_sorted <= block_end[np.maximum(block, 0)])
+    else:
+        inside = np.zeros(len(start), dtype=bool)
+    bad = by_start[~inside]
+    if bad.size:
+        errors.append(f"{bad.size} intervals outside calibrated windows, e.g. job {job_id[bad[0]]} "
+                      f"[{start[bad[0]]}, {end[bad[0]]})")
+
+    # Calibrations μήκους T: τα windows είναι ξένα μεταξύ τους (μία μηχανή) και το καθένα
+    # είναι διαδοχικά calibrations μήκους T, με το τελευταίο ίσως κομμένο στη μεγαλύτερη προθεσμία
+    if T is not None:
+        if T <= 0:
+            errors.append(f"calibration length T = {T} is not positive")
+        else:
+            bad = np.flatnonzero(win_start[w_order][1:] < win_end[w_order][:-1])
+            if bad.size:
+                i, j = w_order[bad[0]], w_order[bad[0] + 1]
+                errors.append(f"{bad.size} overlapping calibration windows, e.g. [{win_start[i]}, {win_end[i]}) "
+                              f"and [{win_start[j]}, {win_end[j]})")
+            active = times > 0
+            latest = deadlines[active].max() if active.any() else 0
+            bad = np.flatnonzero(((win_end - win_start) % T != 0) & (win_end != latest))
+            if bad.size:
+                errors.append(f"{bad.size} calibration windows are not made of calibrations of length T = {T}, "
+                              f"e.g. [{win_start[bad[0]]}, {win_end[bad[0]]})")
+
+    # Τα calibrations που αναφέρθηκαν: ένα ανά window, το τέλος του
+    if calibrations is not None:
+        calibrations = _as_int_array(calibrations)
+        if len(calibrations) != len(win_end):
+            errors.append(f"{len(calibrations)} calibrations reported for {len(win_end)} calibration windows")
+        else:
+            bad = np.flatnonzero(calibrations != win_end)
+            if bad.size:
+                errors.append(f"{bad.size} calibrations differ from the end of their window, e.g. "
+                              f"{calibrations[bad[0]]} != {win_end[bad[0]]}")
+
+    return errors
+
+
+def check_plb(jobs, T):
+    """
+    Εκτελεί το PLB (plb_scheduling_stream) και ελέγχει το αποτέλεσμα με validate_schedule.
+    Δέχεται JobTable ή λίστα Job, χωρίς να τα τροποποιεί.
+    Επιστρέφει:
+     - calibrations (list)
+     - errors (list με μηνύματα, κενή αν το πρόγραμμα είναι έγκυρο)
+    """
+    if isinstance(jobs, JobTable):
+        table = JobTable(jobs.ids[jobs.lo:], jobs.d[jobs.lo:], jobs.p[jobs.lo:])
+    else:
+        table = JobTable.from_jobs(jobs)
+    original = (np.array(table.ids), np.array(table.d), np.array(table.p))
+
+    intervals = IntervalColumns()
+    win_start, win_end = [], []
+
+    def on_window(start, end):
+        win_start.append(start)
+        win_end.append(end)
+
+    calibrations = plb_scheduling_stream(table, T, intervals.append, on_window=on_window)
+    if not calibrations and len(table):
+        return [], ["infeasible instance"]
+    return calibrations, validate_schedule(original, (win_start, win_end), intervals, T, calibrations)
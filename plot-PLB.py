@@ -21,6 +21,12 @@ def process_txt_file(file_path):
     
     return df
 
+# Function to read the CSV written by plb_benchmark.py (median time as sec)
+def process_benchmark_csv(file_path, target="plb"):
+    df = pd.read_csv(file_path)
+    df = df[df["target"] == target]
+    return df.rename(columns={"median": "sec"})[["T", "N", "sec"]]
+
 # Function to plot the processed data
 def plot_data(df):
     # Compute the mean sec for each (T, N) pair
@@ -42,6 +48,9 @@ def plot_data(df):
     plt.show()
 
 # Example usage
-file_path = "outputLSBT.txt"  # Replace with your actual file path
-df = process_txt_file(file_path)
+file_path = "outputLSBT.txt"  # Replace with your actual file path (or benchmarkPLB.csv)
+if file_path.endswith(".csv"):
+    df = process_benchmark_csv(file_path)
+else:
+    df = process_txt_file(file_path)
 plot_data(df)
@@ -1,3 +1,4 @@
+import csv
 import re
 import numpy as np
 import matplotlib.pyplot as plt
@@ -25,6 +26,15 @@ def read_and_process_file(filename):
     
     return aggregated_data
 
+def read_benchmark_csv(filename, target="plb"):
+    """Reads the CSV written by plb_benchmark.py and averages the median time per N."""
+    data_dict = {}
+    with open(filename, 'r', newline='') as file:
+        for row in csv.DictReader(file):
+            if row["target"] == target:
+                data_dict.setdefault(int(row["N"]), []).append(float(row["median"]))
+    return {N: np.mean(times) for N, times in data_dict.items()}
+
 def predict_intermediate_values(aggregated_data):
     min_N = min(aggregated_data.keys())
     max_N = max(aggregated_data.keys())
@@ -54,7 +64,10 @@ def plot_data(aggregated_data):
     plt.show()
 
 if __name__ == "__main__":
-    filename = "outputLSBlog.txt"  # Change this to your actual filename
-    aggregated_data = read_and_process_file(filename)
+    filename = "outputLSBlog.txt"  # Change this to your actual filename (or benchmarkPLB.csv)
+    if filename.endswith(".csv"):
+        aggregated_data = read_benchmark_csv(filename)
+    else:
+        aggregated_data = read_and_process_file(filename)
     predicted_data = predict_intermediate_values(aggregated_data)
     plot_data(predicted_data)